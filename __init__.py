@@ -5,8 +5,8 @@ This package provides a command-line interface for improving ontologies
 using BioPortal and OLS standard terminologies.
 
 Usage:
-    python -m ontology_mapping.cli <ttl_file> [options]
-    python ontology_mapping/main.py <ttl_file> [options]
+    ontology-mapping <ttl_file> [options]
+    python main.py <ttl_file> [options]
 
 Modules:
     cli: Command-line interface
@@ -19,11 +19,39 @@ Modules:
 __version__ = "1.0.0"
 __author__ = "AID-PAIS Research Team"
 
-from .cli import main
-from .core import OntologyParser, ConceptLookup, OntologyGenerator
-from .services import BioPortalLookup, OLSLookup, ResultComparator
-from .utils import LoadingBar, clean_description, deduplicate_synonyms
-from .config import ONTOLOGY_CONFIGS, ONTOLOGY_COMBINATIONS
+import importlib
+
+# Public names and the submodule providing them. They are imported on first
+# access (PEP 562) so that importing the package does not pull in rdflib,
+# requests and the CLI until they are actually needed.
+_LAZY_ATTRIBUTES = {
+    'main': '.cli',
+    'OntologyParser': '.core',
+    'ConceptLookup': '.core',
+    'OntologyGenerator': '.core',
+    'BioPortalLookup': '.services',
+    'OLSLookup': '.services',
+    'ResultComparator': '.services',
+    'LoadingBar': '.utils',
+    'clean_description': '.utils',
+    'deduplicate_synonyms': '.utils',
+    'ONTOLOGY_CONFIGS': '.config',
+    'ONTOLOGY_COMBINATIONS': '.config',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     'main',
@@ -5,27 +5,88 @@ Configuration for the caching mechanism.
 import os
 from typing import Optional
 
+# Accepted spellings for boolean environment variables
+_TRUE_VALUES = frozenset(('true', '1', 'yes', 'on'))
+_FALSE_VALUES = frozenset(('false', '0', 'no', 'off'))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+    
+    Returns:
+        Parsed boolean value
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    print(f"⚠️  Warning: Invalid value for {name}: {value!r}, using {default}")
+    return default
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a non-negative integer environment variable
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset or invalid
+    
+    Returns:
+        Parsed integer value
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value.strip())
+    except ValueError:
+        parsed = -1
+    if parsed < 0:
+        print(f"⚠️  Warning: Invalid value for {name}: {value!r}, using {default}")
+        return default
+    return parsed
+
 
 class CacheConfig:
     """Configuration for cache behavior"""
     
+    # Read on every cache operation; slots keep attribute access cheap and
+    # turn misspelled settings into errors instead of silent new attributes
+    __slots__ = ('enabled', 'ttl', 'stale_ttl', 'negative_ttl', 'cache_dir', 'max_size_mb', 'persistent')
+    
     def __init__(self):
         # Cache enabled by default
-        self.enabled = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
+        self.enabled = _env_bool('CACHE_ENABLED', True)
         
         # Default TTL: 24 hours (in seconds)
-        self.ttl = int(os.getenv('CACHE_TTL', '86400'))
+        self.ttl = _env_int('CACHE_TTL', 86400)
+        
+        # Extra window after the TTL during which stale entries may still be
+        # served while being refreshed in the background (opt-in, 0 = disabled)
+        self.stale_ttl = _env_int('CACHE_STALE_TTL', 0)
+        
+        # TTL for empty results (negative caching), capped by the regular TTL
+        self.negative_ttl = _env_int('CACHE_NEGATIVE_TTL', 300)
         
         # Cache directory for persistent storage
         self.cache_dir = os.getenv('CACHE_DIR', os.path.join(os.path.expanduser('~'), '.ontology_mapper_cache'))
         
         # Max cache size in MB (0 = unlimited)
-        self.max_size_mb = int(os.getenv('CACHE_MAX_SIZE_MB', '100'))
+        self.max_size_mb = _env_int('CACHE_MAX_SIZE_MB', 100)
         
         # Whether to use persistent cache (file-based)
-        self.persistent = os.getenv('CACHE_PERSISTENT', 'true').lower() == 'true'
-        
+        self.persistent = _env_bool('CACHE_PERSISTENT', True)
+    
     def __repr__(self):
-        return (f"CacheConfig(enabled={self.enabled}, ttl={self.ttl}s, "
+        return (f"CacheConfig(enabled={self.enabled}, ttl={self.ttl}s, stale_ttl={self.stale_ttl}s, "
+                f"negative_ttl={self.negative_ttl}s, "
                 f"persistent={self.persistent}, dir={self.cache_dir}, "
                 f"max_size={self.max_size_mb}MB)")
@@ -6,10 +6,102 @@ Provides both in-memory and persistent caching with TTL support.
 import os
 import json
 import time
+import queue
+import atexit
+import zlib
+import sqlite3
 import hashlib
-from typing import Dict, List, Optional, Any
+import weakref
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, NamedTuple, Optional, Any, Set
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Namespace mixed into every key; bump it whenever the entry layout changes so
+# entries written by older versions are never read back.
+CACHE_VERSION = 'v1'
+
+# Single SQLite database holding the persistent tier
+CACHE_DB_FILENAME = 'cache.sqlite3'
+
+# Maximum number of entries waiting to be written to the persistent tier
+WRITE_QUEUE_SIZE = 1024
+
+# Compression level for persistent payloads (zstd level, or zlib level as fallback)
+COMPRESSION_LEVEL = 3
+
+# Frame header written by zstd; zlib streams start with 0x78 and plain JSON with '{' or '['
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a cache entry to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _loads(payload: bytes) -> Any:
+    """Deserialize a cache entry from JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _compress(payload: bytes) -> bytes:
+    """Compress a serialized entry for the persistent tier, using zstd when available"""
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=COMPRESSION_LEVEL).compress(payload)
+    return zlib.compress(payload, COMPRESSION_LEVEL)
+
+
+def _decompress(blob: bytes) -> bytes:
+    """Decompress a stored payload; uncompressed rows from older versions pass through"""
+    if blob[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise ValueError("Cache entry is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    if blob[:1] == b'\x78':
+        return zlib.decompress(blob)
+    return blob
+
+
+# Managers with a persistent tier, closed (and flushed) once at interpreter exit
+_open_managers: 'weakref.WeakSet[CacheManager]' = weakref.WeakSet()
+
+
+def _close_open_managers():
+    """Flush and close every cache manager that is still open"""
+    for manager in list(_open_managers):
+        manager.close()
+
+
+atexit.register(_close_open_managers)
+
+
+class CacheEntry(NamedTuple):
+    """A cached lookup result"""
+    timestamp: float
+    data: List[Dict]
+    query: str
+    ontologies: str
+    service: str
+    # Empty results expire after the shorter negative TTL
+    negative: bool = False
+
 
 class CacheManager:
     """Manages caching for API responses with in-memory and persistent storage"""
@@ -21,69 +113,332 @@ class CacheManager:
             config: CacheConfig instance with cache settings
         """
         self.config = config
-        self.memory_cache: Dict[str, Dict[str, Any]] = {}
+        # LRU-ordered in-memory tier, bounded by config.max_size_mb (0 = unlimited)
+        self.memory_cache: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._memory_sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
         self.stats = {
             'hits': 0,
             'misses': 0,
+            'stale_hits': 0,
             'sets': 0,
             'deletes': 0,
             'errors': 0
         }
+        # Guards both tiers; background refreshes write through set()
+        self._lock = threading.RLock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Set[str] = set()
+        # Keys currently being fetched through get_or_compute(), for single-flight
+        self._inflight: Dict[str, threading.Event] = {}
+        self._db: Optional[sqlite3.Connection] = None
+        # Running size of the persistent tier; computed once on first write
+        self._persistent_bytes: Optional[int] = None
+        # Persistent writes are queued and flushed in batches by a background thread
+        self._write_queue: 'queue.Queue[Optional[tuple]]' = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer: Optional[threading.Thread] = None
         
-        # Create cache directory if persistent cache is enabled
+        # Open the cache database if persistent cache is enabled
         if self.config.persistent and self.config.enabled:
             try:
                 Path(self.config.cache_dir).mkdir(parents=True, exist_ok=True)
+                self._db = self._open_database()
+                # The writer gets its own connection, opened here so a failure
+                # disables the persistent tier instead of killing the thread
+                writer_db = self._open_database()
+                self._writer = threading.Thread(target=self._persist_loop, args=(writer_db,),
+                                                name='cache-writer', daemon=True)
+                self._writer.start()
+                _open_managers.add(self)
             except Exception as e:
-                print(f"⚠️  Warning: Could not create cache directory: {e}")
+                print(f"⚠️  Warning: Could not open persistent cache: {e}")
+                if self._db is not None:
+                    self._db.close()
+                    self._db = None
                 self.config.persistent = False
     
-    def _generate_key(self, query: str, ontologies: str, service: str) -> str:
+    def _open_database(self) -> sqlite3.Connection:
+        """Open (and create if needed) the SQLite database for the persistent tier
+        
+        Returns:
+            Connection in autocommit mode
+        """
+        db = sqlite3.connect(os.path.join(self.config.cache_dir, CACHE_DB_FILENAME),
+                             timeout=10, isolation_level=None, check_same_thread=False)
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute('PRAGMA synchronous=NORMAL')
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            'key TEXT PRIMARY KEY, '
+            'timestamp REAL NOT NULL, '
+            'accessed REAL NOT NULL, '
+            'size INTEGER NOT NULL, '
+            'payload BLOB NOT NULL)'
+        )
+        db.execute('CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)')
+        return db
+    
+    def _persist_loop(self, db: sqlite3.Connection):
+        """Background writer: drain queued entries and store them in one transaction per batch
+        
+        Args:
+            db: Connection owned by the writer thread
+        """
+        try:
+            self._write_batches(db)
+        finally:
+            db.close()
+            # Release flush() callers if the writer stopped unexpectedly
+            while True:
+                try:
+                    self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self._write_queue.task_done()
+    
+    def _write_batches(self, db: sqlite3.Connection):
+        """Store queued entries until the stop sentinel is received
+        
+        Args:
+            db: Connection owned by the writer thread
+        """
+        running = True
+        while running:
+            batch = [self._write_queue.get()]
+            # Pick up everything else already queued so it shares the transaction
+            while True:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            rows = [item for item in batch if item is not None]
+            running = len(rows) == len(batch)
+            # Only the last write per key survives the batch
+            rows = list({row[0]: row for row in rows}.values())
+            try:
+                # Compress here rather than in set() to keep it off the caller's thread
+                compressed = []
+                for key, timestamp, accessed, _, payload in rows:
+                    blob = _compress(payload)
+                    compressed.append((key, timestamp, accessed, len(blob), blob))
+                rows = compressed
+                if rows:
+                    db.execute('BEGIN')
+                    added = sum(row[3] for row in rows)
+                    for row in rows:
+                        replaced = db.execute('SELECT size FROM entries WHERE key = ?', (row[0],)).fetchone()
+                        if replaced:
+                            added -= replaced[0]
+                    db.executemany(
+                        'INSERT OR REPLACE INTO entries (key, timestamp, accessed, size, payload) '
+                        'VALUES (?, ?, ?, ?, ?)', rows
+                    )
+                    db.execute('COMMIT')
+                    
+                    with self._lock:
+                        if self._persistent_bytes is None:
+                            self._persistent_bytes = db.execute(
+                                'SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+                        else:
+                            self._persistent_bytes += added
+                    
+                    # Check cache size and cleanup if needed
+                    self._cleanup_if_needed(db)
+            except Exception as e:
+                if db.in_transaction:
+                    db.execute('ROLLBACK')
+                with self._lock:
+                    self.stats['errors'] += 1
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+    
+    def _writer_running(self) -> bool:
+        """Check whether the background writer accepts persistent writes"""
+        return self._writer is not None and self._writer.is_alive()
+    
+    def flush(self):
+        """Block until all queued persistent writes have been stored"""
+        if self._writer_running():
+            self._write_queue.join()
+    
+    def close(self):
+        """Finish background refreshes, flush pending writes and close the database"""
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=True)
+            self._refresh_executor = None
+        
+        if self._writer is not None:
+            if self._writer.is_alive():
+                self._write_queue.put(None)
+                self._writer.join()
+            self._writer = None
+        _open_managers.discard(self)
+        
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _generate_key(query: str, ontologies: str, service: str) -> str:
         """Generate a cache key from query parameters
         
+        Memoized, since the same query is typically hashed on a get miss and
+        again on the following set.
+        
         Args:
             query: Search query string
             ontologies: Comma-separated ontology list
             service: Service name (bioportal/ols)
             
         Returns:
-            SHA256 hash of the combined parameters
+            128-bit BLAKE2b hex digest of the combined parameters
+        """
+        # Normalize inputs for consistent hashing. The ontology list is treated
+        # as a set so that e.g. "GO,CHEBI" and "chebi, go" share one entry.
+        # Keys only need to be collision-resistant, not cryptographic, so a
+        # short BLAKE2b digest is used instead of SHA-256.
+        ontology_set = {ont.strip().upper() for ont in ontologies.split(',')}
+        ontology_set.discard('')
+        normalized = f"{CACHE_VERSION}|{query.lower().strip()}|{','.join(sorted(ontology_set))}|{service.lower().strip()}"
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    
+    def _memory_put(self, key: str, entry: CacheEntry, size: int):
+        """Insert an entry into the memory tier, evicting least recently used entries
+        
+        Args:
+            key: Cache key
+            entry: Cache entry to store
+            size: Estimated size of the entry in bytes
         """
-        # Normalize inputs for consistent hashing
-        normalized = f"{query.lower().strip()}|{ontologies.upper().strip()}|{service.lower()}"
-        return hashlib.sha256(normalized.encode()).hexdigest()
+        self._memory_pop(key)
+        self.memory_cache[key] = entry
+        self._memory_sizes[key] = size
+        self._memory_bytes += size
+        
+        if self.config.max_size_mb == 0:
+            return
+        
+        max_size_bytes = self.config.max_size_mb * 1024 * 1024
+        # Always keep the newest entry, even if it alone exceeds the limit
+        while self._memory_bytes > max_size_bytes and len(self.memory_cache) > 1:
+            oldest_key = next(iter(self.memory_cache))
+            self._memory_pop(oldest_key)
     
-    def _get_cache_file_path(self, key: str) -> str:
-        """Get the file path for a cache key
+    def _memory_pop(self, key: str) -> bool:
+        """Remove an entry from the memory tier
         
         Args:
             key: Cache key
             
         Returns:
-            Full path to the cache file
+            True if the entry was present, False otherwise
         """
-        return os.path.join(self.config.cache_dir, f"{key}.json")
+        if self.memory_cache.pop(key, None) is None:
+            return False
+        self._memory_bytes -= self._memory_sizes.pop(key, 0)
+        return True
     
-    def _is_expired(self, timestamp: float) -> bool:
+    def _is_expired(self, timestamp: float, grace: int = 0, ttl: Optional[int] = None) -> bool:
         """Check if a cached entry has expired
         
         Args:
             timestamp: Unix timestamp when the entry was cached
+            grace: Extra seconds the entry may be used past its TTL
+            ttl: TTL to apply instead of the configured one
             
         Returns:
             True if expired, False otherwise
         """
-        if self.config.ttl == 0:  # 0 means no expiration
+        if ttl is None:
+            ttl = self.config.ttl
+        if ttl == 0:  # 0 means no expiration
             return False
-        return time.time() - timestamp > self.config.ttl
+        return time.time() - timestamp > ttl + grace
+    
+    def _entry_ttl(self, entry: CacheEntry) -> int:
+        """Get the TTL for an entry; empty results use the shorter negative TTL
+        
+        Args:
+            entry: Cache entry
+            
+        Returns:
+            TTL in seconds (0 = no expiration)
+        """
+        if entry.negative and self.config.negative_ttl:
+            if self.config.ttl == 0:
+                return self.config.negative_ttl
+            return min(self.config.ttl, self.config.negative_ttl)
+        return self.config.ttl
+    
+    def _lookup(self, key: str, allow_stale: bool) -> Optional[CacheEntry]:
+        """Find a usable entry in the memory or persistent tier
+        
+        Entries past their TTL are kept while inside the stale window so that
+        stale-while-revalidate callers can still use them.
+        
+        Args:
+            key: Cache key
+            allow_stale: Whether entries inside the stale window are usable
+            
+        Returns:
+            Cache entry or None if not found/expired
+        """
+        grace = self.config.stale_ttl if allow_stale else 0
+        
+        # Try memory cache first
+        entry = self.memory_cache.get(key)
+        if entry is not None:
+            ttl = self._entry_ttl(entry)
+            # Empty results get no stale window, or they would outlive the negative TTL
+            stale_ttl = 0 if entry.negative else self.config.stale_ttl
+            if not self._is_expired(entry.timestamp, min(grace, stale_ttl), ttl):
+                self.memory_cache.move_to_end(key)
+                return entry
+            elif self._is_expired(entry.timestamp, stale_ttl, ttl):
+                # Remove entry that is past the stale window as well
+                self._memory_pop(key)
+        
+        # Try persistent cache
+        if self._db is not None:
+            try:
+                row = self._db.execute(
+                    'SELECT timestamp, payload FROM entries WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    timestamp, payload = row
+                    if not self._is_expired(timestamp, grace):
+                        raw = _decompress(payload)
+                        entry = CacheEntry(**_loads(raw))
+                        # Load into memory cache and record the access for LRU eviction
+                        self._memory_put(key, entry, len(raw))
+                        self._db.execute('UPDATE entries SET accessed = ? WHERE key = ?',
+                                         (time.time(), key))
+                        return entry
+                    elif self._is_expired(timestamp, self.config.stale_ttl):
+                        # Remove expired entry
+                        self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+                        if self._persistent_bytes is not None:
+                            self._persistent_bytes -= len(payload)
+            except Exception as e:
+                self.stats['errors'] += 1
+                # Silently fail and treat as cache miss
+        
+        return None
     
-    def get(self, query: str, ontologies: str, service: str) -> Optional[List[Dict]]:
+    def get(self, query: str, ontologies: str, service: str,
+            refresh_callback: Optional[Callable[[], Optional[List[Dict]]]] = None) -> Optional[List[Dict]]:
         """Get cached results for a query
         
         Args:
             query: Search query string
             ontologies: Comma-separated ontology list
             service: Service name (bioportal/ols)
+            refresh_callback: Optional function fetching fresh results. When given,
+                an entry past its TTL but inside the stale window is returned
+                immediately and refreshed in the background (stale-while-revalidate).
             
         Returns:
             Cached results or None if not found/expired
@@ -93,38 +448,114 @@ class CacheManager:
         
         key = self._generate_key(query, ontologies, service)
         
-        # Try memory cache first
-        if key in self.memory_cache:
-            entry = self.memory_cache[key]
-            if not self._is_expired(entry['timestamp']):
-                self.stats['hits'] += 1
-                return entry['data']
-            else:
-                # Remove expired entry
-                del self.memory_cache[key]
+        with self._lock:
+            entry = self._lookup(key, allow_stale=refresh_callback is not None)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            
+            self.stats['hits'] += 1
+            if self._is_expired(entry.timestamp, ttl=self._entry_ttl(entry)):
+                self.stats['stale_hits'] += 1
+                self._schedule_refresh(key, query, ontologies, service, refresh_callback)
+            return entry.data
+    
+    def contains(self, query: str, ontologies: str, service: str) -> bool:
+        """Check for a fresh cached entry without counting a hit or miss
         
-        # Try persistent cache
-        if self.config.persistent:
-            try:
-                cache_file = self._get_cache_file_path(key)
-                if os.path.exists(cache_file):
-                    with open(cache_file, 'r') as f:
-                        entry = json.load(f)
-                    
-                    if not self._is_expired(entry['timestamp']):
-                        # Load into memory cache
-                        self.memory_cache[key] = entry
-                        self.stats['hits'] += 1
-                        return entry['data']
-                    else:
-                        # Remove expired file
-                        os.remove(cache_file)
-            except Exception as e:
-                self.stats['errors'] += 1
-                # Silently fail and treat as cache miss
+        Args:
+            query: Search query string
+            ontologies: Comma-separated ontology list
+            service: Service name (bioportal/ols)
+            
+        Returns:
+            True if a non-expired entry is cached
+        """
+        if not self.config.enabled:
+            return False
         
-        self.stats['misses'] += 1
-        return None
+        key = self._generate_key(query, ontologies, service)
+        with self._lock:
+            return self._lookup(key, allow_stale=False) is not None
+    
+    def get_or_compute(self, query: str, ontologies: str, service: str,
+                       fetch_fn: Callable[[], Optional[List[Dict]]],
+                       prefetch: bool = False) -> Optional[List[Dict]]:
+        """Return cached results, or fetch and cache them with at most one fetch per key
+        
+        Concurrent callers for the same uncached query wait for the first
+        caller's fetch instead of sending duplicate API requests. Meant for the
+        miss path after get(), so the initial miss is not counted again.
+        
+        Args:
+            query: Search query string
+            ontologies: Comma-separated ontology list
+            service: Service name (bioportal/ols)
+            fetch_fn: Called without arguments to fetch fresh results; exceptions propagate
+            prefetch: Background warming with no get() before it; records a miss
+                only when fetch_fn actually runs, and nothing for cached keys
+            
+        Returns:
+            Cached or freshly fetched results
+        """
+        if not self.config.enabled:
+            return fetch_fn()
+        
+        key = self._generate_key(query, ontologies, service)
+        
+        while True:
+            with self._lock:
+                entry = self._lookup(key, allow_stale=False)
+                if entry is not None:
+                    # Filled by a concurrent caller in the meantime; the lookup
+                    # was already counted by the get() or prefetch before it
+                    return entry.data
+                
+                event = self._inflight.get(key)
+                if event is None:
+                    event = self._inflight[key] = threading.Event()
+                    if prefetch:
+                        self.stats['misses'] += 1
+                    break
+            
+            # Another thread is fetching this key; re-check once it is done.
+            # If its fetch failed, this caller takes over.
+            event.wait()
+        
+        try:
+            data = fetch_fn()
+            if data is not None:
+                self.set(query, ontologies, service, data)
+            return data
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            event.set()
+    
+    def _schedule_refresh(self, key: str, query: str, ontologies: str, service: str,
+                          refresh_callback: Callable[[], Optional[List[Dict]]]):
+        """Refresh a stale entry in the background, at most once per key at a time"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        
+        if self._refresh_executor is None:
+            self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cache-refresh')
+        self._refresh_executor.submit(self._refresh, key, query, ontologies, service, refresh_callback)
+    
+    def _refresh(self, key: str, query: str, ontologies: str, service: str,
+                 refresh_callback: Callable[[], Optional[List[Dict]]]):
+        """Fetch fresh results and store them, keeping the stale entry on failure"""
+        try:
+            data = refresh_callback()
+            if data is not None:
+                self.set(query, ontologies, service, data)
+        except Exception as e:
+            with self._lock:
+                self.stats['errors'] += 1
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
     
     def set(self, query: str, ontologies: str, service: str, data: List[Dict]) -> bool:
         """Cache results for a query
@@ -142,31 +573,27 @@ class CacheManager:
             return False
         
         key = self._generate_key(query, ontologies, service)
-        entry = {
-            'timestamp': time.time(),
-            'data': data,
-            'query': query,
-            'ontologies': ontologies,
-            'service': service
-        }
+        # Empty results are negative entries, remembered briefly so repeated
+        # misses do not hit the API
+        entry = CacheEntry(time.time(), data, query, ontologies, service, negative=not data)
         
-        # Store in memory cache
-        self.memory_cache[key] = entry
+        try:
+            payload = _dumps(entry._asdict())
+        except (TypeError, ValueError):
+            # Results that cannot be serialized are not cached at all
+            self.stats['errors'] += 1
+            return False
         
-        # Store in persistent cache
-        if self.config.persistent:
-            try:
-                cache_file = self._get_cache_file_path(key)
-                with open(cache_file, 'w') as f:
-                    json.dump(entry, f)
-                
-                # Check cache size and cleanup if needed
-                self._cleanup_if_needed()
-            except Exception as e:
-                self.stats['errors'] += 1
-                # Continue even if persistent cache fails
+        with self._lock:
+            # Store in memory cache
+            self._memory_put(key, entry, len(payload))
+            self.stats['sets'] += 1
+        
+        # Hand the entry to the background writer for the persistent cache;
+        # negative entries are too short-lived to be worth persisting
+        if not entry.negative and self._writer_running():
+            self._write_queue.put((key, entry.timestamp, entry.timestamp, len(payload), payload))
         
-        self.stats['sets'] += 1
         return True
     
     def delete(self, query: str, ontologies: str, service: str) -> bool:
@@ -186,23 +613,28 @@ class CacheManager:
         key = self._generate_key(query, ontologies, service)
         deleted = False
         
-        # Remove from memory cache
-        if key in self.memory_cache:
-            del self.memory_cache[key]
-            deleted = True
+        # Make sure a queued write cannot resurrect the entry afterwards
+        self.flush()
         
-        # Remove from persistent cache
-        if self.config.persistent:
-            try:
-                cache_file = self._get_cache_file_path(key)
-                if os.path.exists(cache_file):
-                    os.remove(cache_file)
-                    deleted = True
-            except Exception as e:
-                self.stats['errors'] += 1
-        
-        if deleted:
-            self.stats['deletes'] += 1
+        with self._lock:
+            # Remove from memory cache
+            if self._memory_pop(key):
+                deleted = True
+            
+            # Remove from persistent cache
+            if self._db is not None:
+                try:
+                    row = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+                    if row:
+                        self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+                        if self._persistent_bytes is not None:
+                            self._persistent_bytes -= row[0]
+                        deleted = True
+                except Exception as e:
+                    self.stats['errors'] += 1
+            
+            if deleted:
+                self.stats['deletes'] += 1
         
         return deleted
     
@@ -214,19 +646,36 @@ class CacheManager:
         """
         count = 0
         
-        # Clear memory cache
-        count += len(self.memory_cache)
-        self.memory_cache.clear()
+        self.flush()
         
-        # Clear persistent cache
-        if self.config.persistent and os.path.exists(self.config.cache_dir):
-            try:
-                for filename in os.listdir(self.config.cache_dir):
-                    if filename.endswith('.json'):
-                        os.remove(os.path.join(self.config.cache_dir, filename))
-                        count += 1
-            except Exception as e:
-                self.stats['errors'] += 1
+        with self._lock:
+            # Clear memory cache
+            count += len(self.memory_cache)
+            self.memory_cache.clear()
+            self._memory_sizes.clear()
+            self._memory_bytes = 0
+            
+            # Clear persistent cache
+            if self._db is not None:
+                try:
+                    count += self._db.execute('DELETE FROM entries').rowcount
+                    self._persistent_bytes = 0
+                    
+                    # Remove per-entry JSON files left behind by older cache versions
+                    with os.scandir(self.config.cache_dir) as it:
+                        for dir_entry in it:
+                            if dir_entry.name.endswith('.json'):
+                                try:
+                                    os.unlink(dir_entry.path)
+                                    count += 1
+                                except FileNotFoundError:
+                                    # Already removed by another process
+                                    pass
+                except FileNotFoundError:
+                    # Cache directory was removed; nothing left to clear
+                    pass
+                except Exception as e:
+                    self.stats['errors'] += 1
         
         return count
     
@@ -243,37 +692,45 @@ class CacheManager:
             'enabled': self.config.enabled,
             'hits': self.stats['hits'],
             'misses': self.stats['misses'],
+            'stale_hits': self.stats['stale_hits'],
             'hit_rate': f"{hit_rate:.1f}%",
             'sets': self.stats['sets'],
             'deletes': self.stats['deletes'],
             'errors': self.stats['errors'],
             'memory_entries': len(self.memory_cache),
+            'memory_bytes': self._memory_bytes,
+            'persistent_bytes': self._persistent_bytes or 0,
             'persistent_enabled': self.config.persistent,
             'ttl_seconds': self.config.ttl
         }
     
-    def _cleanup_if_needed(self):
-        """Clean up old cache files if size limit is exceeded"""
+    def _cleanup_if_needed(self, db: sqlite3.Connection):
+        """Evict least recently used entries if the persistent size limit is exceeded
+        
+        Args:
+            db: Connection to run the eviction on
+        """
         if not self.config.persistent or self.config.max_size_mb == 0:
             return
         
+        max_size_bytes = self.config.max_size_mb * 1024 * 1024
+        # Cheap check against the running total; no table scan on the common path
+        if self._persistent_bytes is None or self._persistent_bytes <= max_size_bytes:
+            return
+        
         try:
-            cache_dir = Path(self.config.cache_dir)
-            if not cache_dir.exists():
-                return
-            
-            # Calculate total size
-            total_size = sum(f.stat().st_size for f in cache_dir.glob('*.json'))
-            max_size_bytes = self.config.max_size_mb * 1024 * 1024
-            
-            if total_size > max_size_bytes:
-                # Remove oldest files until under limit
-                files = sorted(cache_dir.glob('*.json'), key=lambda f: f.stat().st_mtime)
-                for file in files:
-                    if total_size <= max_size_bytes:
-                        break
-                    file_size = file.stat().st_size
-                    file.unlink()
-                    total_size -= file_size
+            excess = self._persistent_bytes - max_size_bytes
+            freed = 0
+            # Walk the access-time index from the oldest entry until under limit
+            evicted = []
+            for key, size in db.execute('SELECT key, size FROM entries ORDER BY accessed'):
+                if freed >= excess:
+                    break
+                evicted.append((key,))
+                freed += size
+            db.executemany('DELETE FROM entries WHERE key = ?', evicted)
+            with self._lock:
+                self._persistent_bytes -= freed
         except Exception as e:
-            self.stats['errors'] += 1
+            with self._lock:
+                self.stats['errors'] += 1
@@ -2,7 +2,29 @@
 CLI module for ontology mapping tool.
 """
 
-from .interface import CLIInterface
+import importlib
+
 from .main import main
 
+# Imported on first access (PEP 562), so the console-script entry point
+# cli.main:main does not load the interface before main() runs. main itself
+# stays eager: the submodule of the same name would otherwise shadow it.
+_LAZY_ATTRIBUTES = {
+    'CLIInterface': '.interface',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
 __all__ = ['CLIInterface', 'main']
@@ -3,15 +3,129 @@ CLI interface for the ontology mapping tool.
 """
 
 import os
+import re
 import sys
 import json
 import argparse
-from typing import Dict, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List
 
-from services import BioPortalLookup, OLSLookup
-from core import OntologyParser, SchemaParser, ConceptLookup, OntologyGenerator
-from config import ONTOLOGY_CONFIGS, ONTOLOGY_COMBINATIONS
-from cache import CacheManager, CacheConfig
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Service, core and config modules pull in requests and rdflib, so they are
+# imported where they are first used. This keeps --help and the --list-*
+# options fast.
+if TYPE_CHECKING:
+    from cache import CacheManager
+    from core import ConceptLookup, OntologyGenerator
+
+# Icon shown in front of a result, by result source (demo results get 🎭)
+_SOURCE_ICONS = {'bioportal': '🌐', 'ols': '🔬'}
+
+# Section separators, built once instead of on every print
+_SEP_40 = "=" * 40
+_SEP_45 = "=" * 45
+_SEP_50 = "=" * 50
+_SEP_60 = "=" * 60
+
+# Start-of-run banner
+_CLI_BANNER = "\n🔧 BioPortal & OLS Ontology Alignment CLI\n" + _SEP_45
+
+# Per-concept banner in interactive selection
+_STEP_BANNER = "\n" + _SEP_60 + "\n🔍 Step {step}/{total}: {label} ({type})\n" + _SEP_60
+
+# Valid selection input: comma-separated option numbers (empty parts are ignored)
+_SELECTION_RE = re.compile(r'^\s*(\d+\s*)?(,\s*(\d+\s*)?)*$')
+_OPTION_NUMBER_RE = re.compile(r'\d+')
+
+# Characters replaced when turning a --single-word term into a concept key
+_KEY_TRANS = str.maketrans({' ': '_', '\t': '_', '/': '_', '\\': '_'})
+
+# Input kind by file extension; .json is left out because it may be a schema or JSON-LD
+_INPUT_KIND_BY_EXTENSION = {
+    '.yaml': 'yaml', '.yml': 'yaml',
+    '.md': 'markdown', '.markdown': 'markdown',
+    **dict.fromkeys(('.ttl', '.turtle', '.jsonld', '.rdf', '.owl', '.xml', '.nt', '.n3', '.trig', '.nq', '.nquads'), 'rdf'),
+}
+
+# Leading "key:" line of a YAML document
+_YAML_KEY_RE = re.compile(rb'^[A-Za-z_][\w-]*:(\s|$)')
+
+# JSON-LD keywords used as object keys; compacted documents have "@context",
+# expanded and flattened ones at least "@id", "@type" or "@graph"
+_JSONLD_KEYWORD_RE = re.compile(rb'"@(context|id|type|graph)"\s*:')
+
+# Markdown heading line, "# " followed by text
+_MARKDOWN_HEADING_RE = re.compile(rb'^#{1,6}[ \t]+\S', re.MULTILINE)
+
+# Turtle/SPARQL-style directives or IRIs, which a Turtle file may start with after
+# "#" comments that look like Markdown headings
+_TURTLE_STATEMENT_RE = re.compile(rb'^[ \t]*(@prefix|@base|prefix[ \t]|base[ \t])|<https?:',
+                                  re.IGNORECASE | re.MULTILINE)
+
+# How much of a JSON file is searched for JSON-LD keywords
+_JSON_SNIFF_BYTES = 64 * 1024
+
+# Number of upcoming concepts looked up in the background during interactive selection
+PREFETCH_AHEAD = 4
+
+
+def _detect_input_kind(path: str) -> str:
+    """Guess whether an input file is RDF or a schema file
+    
+    Uses the file extension, falling back to the start of the file so that
+    schema files are never handed to the RDF parser. JSON counts as JSON-LD
+    when a JSON-LD keyword key shows up in its first 64 KiB.
+    
+    Args:
+        path: Path to the input file
+        
+    Returns:
+        'rdf', 'yaml', 'json' or 'markdown'
+    """
+    kind = _INPUT_KIND_BY_EXTENSION.get(os.path.splitext(path)[1].lower())
+    if kind:
+        return kind
+    
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(512).lstrip()
+            if head.startswith((b'{', b'[')) and not _JSONLD_KEYWORD_RE.search(head):
+                # Keywords may follow long values, e.g. in expanded JSON-LD
+                head += f.read(_JSON_SNIFF_BYTES)
+    except OSError:
+        return 'rdf'
+    
+    if head.startswith((b'<?xml', b'<rdf:', b'@prefix', b'@base', b'PREFIX', b'BASE')):
+        return 'rdf'
+    if head.startswith((b'{', b'[')):
+        return 'rdf' if _JSONLD_KEYWORD_RE.search(head) else 'json'
+    if head.startswith(b'---') or _YAML_KEY_RE.match(head):
+        return 'yaml'
+    if _MARKDOWN_HEADING_RE.search(head) and not _TURTLE_STATEMENT_RE.search(head):
+        return 'markdown'
+    return 'rdf'
+
+
+def _input_format_arg(value: str) -> str:
+    """argparse type for --input-format, rejecting unknown formats before any work is done"""
+    from core.formats import SUPPORTED_INPUT_FORMATS
+    fmt = value.strip().lower()
+    if fmt not in SUPPORTED_INPUT_FORMATS and fmt not in ('yaml', 'json', 'markdown', 'md'):
+        raise argparse.ArgumentTypeError(f"unsupported input format: {value!r} (see --list-input-formats)")
+    return value
+
+
+def _output_format_arg(value: str) -> str:
+    """argparse type for --format; like the generator, also accepts a file name with a known extension"""
+    from core.formats import SUPPORTED_FORMATS
+    fmt = value.strip().lower()
+    if fmt not in SUPPORTED_FORMATS and fmt.rsplit('.', 1)[-1] not in SUPPORTED_FORMATS:
+        raise argparse.ArgumentTypeError(f"unsupported output format: {value!r} (see --list-formats)")
+    return value
 
 
 class SchemaGraphWrapper:
@@ -26,7 +140,14 @@ class CLIInterface:
     """Command-line interface for the tool"""
     
     def __init__(self):
-        self.parser = self._create_parser()
+        self._parser = None
+    
+    @property
+    def parser(self) -> argparse.ArgumentParser:
+        """Argument parser, built on first use"""
+        if self._parser is None:
+            self._parser = self._create_parser()
+        return self._parser
         
     def _create_parser(self) -> argparse.ArgumentParser:
         """Create command-line argument parser"""
@@ -43,12 +164,14 @@ Examples:
             """
         )
         
-        # Make ttl_file optional when using single-word mode
-        parser.add_argument('ttl_file', nargs='?', help='Path to ontology/schema file (RDF, YAML, JSON, or Markdown)')
+        # File mode and single-word mode are exclusive, so argparse rejects
+        # mixed invocations before any mode-specific validation runs
+        mode = parser.add_mutually_exclusive_group()
+        ttl_file_arg = mode.add_argument('ttl_file', nargs='?', help='Path to ontology/schema file (RDF, YAML, JSON, or Markdown)')
         parser.add_argument('--output', '-o', default='improved_ontology.ttl',
                           help='Output file for improved ontology (default: improved_ontology.ttl)')
         parser.add_argument('--api-key', help='BioPortal API key (or set BIOPORTAL_API_KEY env var)')
-        parser.add_argument('--batch-mode', help='JSON file with pre-selected choices for batch processing')
+        batch_mode_arg = parser.add_argument('--batch-mode', help='JSON file with pre-selected choices for batch processing')
         parser.add_argument('--report', 
                           help='Output file for alignment report (only generated if specified)')
         parser.add_argument('--disable-ols', action='store_true',
@@ -61,7 +184,7 @@ Examples:
         # New arguments for ontology selection and single word queries
         parser.add_argument('--ontologies', '-ont', 
                           help='Comma-separated list of ontologies to search (e.g., HP,NCIT,MONDO)')
-        parser.add_argument('--single-word', '-sw',
+        mode.add_argument('--single-word', '-sw',
                           help='Query a single word/term instead of processing an ontology file')
         parser.add_argument('--list-ontologies', action='store_true',
                           help='Show available ontologies and exit')
@@ -71,9 +194,9 @@ Examples:
                           help='Only print results to terminal, do not generate output files')
         
         # Format arguments
-        parser.add_argument('--input-format', '--if',
+        parser.add_argument('--input-format', '--if', type=_input_format_arg,
                           help='Input format: turtle/ttl, json-ld, xml/rdf-xml, nt/ntriples, n3, trig, nquads, yaml, json, markdown (auto-detected from extension if not specified)')
-        parser.add_argument('--format', '-f',
+        parser.add_argument('--format', '-f', type=_output_format_arg,
                           help='Output format: turtle/ttl (default), json-ld, xml/rdf-xml, nt/ntriples, n3, trig, nquads, csv, tsv, sssom')
         parser.add_argument('--list-formats', action='store_true',
                           help='Show available input and output formats and exit')
@@ -90,116 +213,176 @@ Examples:
         parser.add_argument('--no-cache', action='store_true',
                           help='Disable cache for this run')
         
+        # Shell completion (--print-completion bash|zsh|tcsh) when shtab is installed
+        try:
+            import shtab
+        except ImportError:
+            pass
+        else:
+            ttl_file_arg.complete = shtab.FILE
+            batch_mode_arg.complete = shtab.FILE
+            shtab.add_argument_to(parser, ['--print-completion'])
+        
         return parser
     
     def _list_available_ontologies(self):
         """Display available ontologies and their descriptions"""
-        print("\n🔍 Available Ontologies")
-        print("=" * 50)
-        
-        print("\n📋 Individual Ontologies:")
-        for ont, desc in ONTOLOGY_CONFIGS.items():
-            print(f"  {ont:12s} - {desc}")
-        
-        print("\n🎯 Recommended Combinations:")
-        for category, onts in ONTOLOGY_COMBINATIONS.items():
-            print(f"  {category:15s} - {onts}")
-        
-        print("\n💡 Usage Examples:")
-        print("  --ontologies 'HP,NCIT'           # Phenotypes and clinical terms")
-        print("  --ontologies 'MONDO,DOID'        # Disease ontologies")
-        print("  --ontologies 'CHEBI,RXNORM'      # Chemical and drug terms")
-        print("  --ontologies 'GO,PRO'            # Gene/protein related")
-        print("\n")
+        from config import ONTOLOGY_CONFIGS, ONTOLOGY_COMBINATIONS
+        
+        # Build the whole listing and write it at once instead of line by line
+        lines = ["\n🔍 Available Ontologies", _SEP_50]
+        
+        lines.append("\n📋 Individual Ontologies:")
+        lines.extend(f"  {ont:12s} - {desc}" for ont, desc in ONTOLOGY_CONFIGS.items())
+        
+        lines.append("\n🎯 Recommended Combinations:")
+        lines.extend(f"  {category:15s} - {onts}" for category, onts in ONTOLOGY_COMBINATIONS.items())
+        
+        lines.append("\n💡 Usage Examples:")
+        lines.append("  --ontologies 'HP,NCIT'           # Phenotypes and clinical terms")
+        lines.append("  --ontologies 'MONDO,DOID'        # Disease ontologies")
+        lines.append("  --ontologies 'CHEBI,RXNORM'      # Chemical and drug terms")
+        lines.append("  --ontologies 'GO,PRO'            # Gene/protein related")
+        lines.append("\n")
+        print("\n".join(lines))
     
     def _list_available_input_formats(self):
         """Display available input formats and their descriptions"""
-        from core.parser import OntologyParser
-        
-        print("\n📥 Available Input Formats")
-        print("=" * 50)
-        
-        print("\n📊 RDF Formats (via rdflib):")
-        descriptions = OntologyParser.get_input_format_descriptions()
-        for fmt in sorted(descriptions.keys()):
-            print(f"  {fmt:12s} - {descriptions[fmt]}")
-        
-        print("\n📋 Schema Formats (with ontology_mappings):")
-        print(f"  yaml         - YAML schema files with ontology mappings")
-        print(f"  json         - JSON schema files with ontology mappings")
-        print(f"  markdown     - Markdown documentation with ontology mappings")
-        
-        print("\n💡 Usage Examples:")
-        print("  --input-format json-ld           # Parse JSON-LD RDF input")
-        print("  --input-format xml               # Parse RDF/XML input")
-        print("  --input-format yaml --schema-mode  # Parse YAML schema")
-        print("  python main.py schema.yaml --schema-mode")
-        print("  python main.py ontology.jsonld   # Auto-detect RDF format")
-        print("\n")
+        from core.formats import INPUT_FORMAT_DESCRIPTIONS
+        
+        lines = ["\n📥 Available Input Formats", _SEP_50]
+        
+        lines.append("\n📊 RDF Formats (via rdflib):")
+        lines.extend(f"  {fmt:12s} - {INPUT_FORMAT_DESCRIPTIONS[fmt]}" for fmt in sorted(INPUT_FORMAT_DESCRIPTIONS))
+        
+        lines.append("\n📋 Schema Formats (with ontology_mappings):")
+        lines.append("  yaml         - YAML schema files with ontology mappings")
+        lines.append("  json         - JSON schema files with ontology mappings")
+        lines.append("  markdown     - Markdown documentation with ontology mappings")
+        
+        lines.append("\n💡 Usage Examples:")
+        lines.append("  --input-format json-ld           # Parse JSON-LD RDF input")
+        lines.append("  --input-format xml               # Parse RDF/XML input")
+        lines.append("  --input-format yaml --schema-mode  # Parse YAML schema")
+        lines.append("  python main.py schema.yaml --schema-mode")
+        lines.append("  python main.py ontology.jsonld   # Auto-detect RDF format")
+        lines.append("\n")
+        print("\n".join(lines))
     
     def _list_available_formats(self):
         """Display available input and output formats and their descriptions"""
-        from core.generator import OntologyGenerator
-        from core.parser import OntologyParser
+        from core.formats import FORMAT_DESCRIPTIONS, INPUT_FORMAT_DESCRIPTIONS
         
-        print("\n📄 Available Input and Output Formats")
-        print("=" * 50)
+        lines = ["\n📄 Available Input and Output Formats", _SEP_50]
         
-        print("\n📥 INPUT FORMATS")
-        print("\nRDF Formats (via rdflib):")
-        input_descriptions = OntologyParser.get_input_format_descriptions()
-        for fmt in sorted(input_descriptions.keys()):
-            print(f"  {fmt:12s} - {input_descriptions[fmt]}")
+        lines.append("\n📥 INPUT FORMATS")
+        lines.append("\nRDF Formats (via rdflib):")
+        lines.extend(f"  {fmt:12s} - {INPUT_FORMAT_DESCRIPTIONS[fmt]}" for fmt in sorted(INPUT_FORMAT_DESCRIPTIONS))
         
-        print("\nSchema Formats (with ontology_mappings):")
-        print(f"  yaml         - YAML schema files")
-        print(f"  json         - JSON schema files")
-        print(f"  markdown     - Markdown documentation")
+        lines.append("\nSchema Formats (with ontology_mappings):")
+        lines.append("  yaml         - YAML schema files")
+        lines.append("  json         - JSON schema files")
+        lines.append("  markdown     - Markdown documentation")
         
-        print("\n📤 OUTPUT FORMATS")
-        print("\n📊 RDF Formats (via rdflib):")
+        lines.append("\n📤 OUTPUT FORMATS")
+        lines.append("\n📊 RDF Formats (via rdflib):")
         rdf_formats = ['turtle', 'json-ld', 'xml', 'nt', 'n3', 'trig', 'nquads']
-        output_descriptions = OntologyGenerator.get_format_descriptions()
-        for fmt in rdf_formats:
-            if fmt in output_descriptions:
-                print(f"  {fmt:12s} - {output_descriptions[fmt]}")
+        lines.extend(f"  {fmt:12s} - {FORMAT_DESCRIPTIONS[fmt]}" for fmt in rdf_formats if fmt in FORMAT_DESCRIPTIONS)
         
-        print("\n📋 Tabular Formats (custom export):")
+        lines.append("\n📋 Tabular Formats (custom export):")
         tabular_formats = ['csv', 'tsv', 'sssom']
-        for fmt in tabular_formats:
-            if fmt in output_descriptions:
-                print(f"  {fmt:12s} - {output_descriptions[fmt]}")
-        
-        print("\n💡 Usage Examples:")
-        print("  # Input format")
-        print("  python main.py data.jsonld --input-format json-ld")
-        print("  python main.py ontology.rdf        # Auto-detect input format")
-        print()
-        print("  # Output format")
-        print("  python main.py data.ttl --format json-ld --output result.jsonld")
-        print("  python main.py data.jsonld --format sssom --output mappings.sssom.tsv")
-        print("\n")
+        lines.extend(f"  {fmt:12s} - {FORMAT_DESCRIPTIONS[fmt]}" for fmt in tabular_formats if fmt in FORMAT_DESCRIPTIONS)
+        
+        lines.append("\n💡 Usage Examples:")
+        lines.append("  # Input format")
+        lines.append("  python main.py data.jsonld --input-format json-ld")
+        lines.append("  python main.py ontology.rdf        # Auto-detect input format")
+        lines.append("")
+        lines.append("  # Output format")
+        lines.append("  python main.py data.ttl --format json-ld --output result.jsonld")
+        lines.append("  python main.py data.jsonld --format sssom --output mappings.sssom.tsv")
+        lines.append("\n")
+        print("\n".join(lines))
+
+    def _listings(self):
+        """Informational --list-* options in order of precedence
+        
+        Returns:
+            Tuple of (flag, argument name, display method) entries
+        """
+        return (
+            ('--list-ontologies', 'list_ontologies', self._list_available_ontologies),
+            ('--list-input-formats', 'list_input_formats', self._list_available_input_formats),
+            ('--list-formats', 'list_formats', self._list_available_formats),
+        )
+    
+    def _run_listing(self, argv: List[str]) -> bool:
+        """Show a listing before argument parsing when only --list-* flags are given
+        
+        Anything else on the command line (abbreviations, other options,
+        option values) is left to argparse and the parsed-argument checks.
+        
+        Args:
+            argv: Command-line arguments (without the program name)
+            
+        Returns:
+            True if a listing was shown and the CLI should exit
+        """
+        listings = self._listings()
+        if not argv or not set(argv) <= {flag for flag, _, _ in listings}:
+            return False
+        for flag, _, show in listings:
+            if flag in argv:
+                show()
+                return True
+        return False
+    
+    def _validate_args(self, args):
+        """Check arguments and input paths, exiting on errors
+        
+        Runs before the cache and lookup services are set up, so invalid
+        invocations fail immediately.
+        """
+        if not args.single_word and not args.ttl_file:
+            print("❌ Error: Either provide a TTL file or use --single-word option")
+            self.parser.print_help()
+            sys.exit(1)
+        
+        if args.ttl_file:
+            try:
+                os.stat(args.ttl_file)
+            except OSError:
+                print(f"❌ Error: File {args.ttl_file} not found")
+                sys.exit(1)
+        
+        if args.batch_mode and not os.path.isfile(args.batch_mode):
+            print(f"❌ Error: Batch file {args.batch_mode} not found")
+            sys.exit(1)
+        
+        if args.disable_ols and args.disable_bioportal:
+            print("❌ Error: --disable-ols and --disable-bioportal cannot be used together")
+            sys.exit(1)
 
     def run(self):
         """Main CLI entry point"""
-        args = self.parser.parse_args()
-        
-        # Handle list ontologies
-        if args.list_ontologies:
-            self._list_available_ontologies()
+        # Plain listing invocations skip parsing; this is only a shortcut
+        if self._run_listing(sys.argv[1:]):
             return
         
-        # Handle list input formats
-        if args.list_input_formats:
-            self._list_available_input_formats()
-            return
+        args = self.parser.parse_args()
         
-        # Handle list formats (both input and output)
-        if args.list_formats:
-            self._list_available_formats()
-            return
+        # Listings need no input, cache or services
+        for _, name, show in self._listings():
+            if getattr(args, name):
+                show()
+                return
+        
+        # Cache commands need no input; everything else is validated up front
+        if not args.clear_cache and not args.cache_stats:
+            self._validate_args(args)
         
         # Initialize cache
+        from cache import CacheManager, CacheConfig
         cache_config = CacheConfig()
         if args.no_cache:
             cache_config.enabled = False
@@ -215,18 +398,7 @@ Examples:
             self._show_cache_stats(cache)
             return
         
-        # Validate arguments
-        if not args.single_word and not args.ttl_file:
-            print("❌ Error: Either provide a TTL file or use --single-word option")
-            self.parser.print_help()
-            sys.exit(1)
-        
-        if args.ttl_file and not os.path.exists(args.ttl_file):
-            print(f"❌ Error: File {args.ttl_file} not found")
-            sys.exit(1)
-        
-        print(f"\n🔧 BioPortal & OLS Ontology Alignment CLI")
-        print("=" * 45)
+        print(_CLI_BANNER)
         
         # Show cache status
         if cache_config.enabled:
@@ -235,6 +407,8 @@ Examples:
             print(f"💾 Cache: Disabled")
         
         # Initialize components with shared cache
+        from services import BioPortalLookup, OLSLookup
+        from core import ConceptLookup, OntologyGenerator
         bioportal = BioPortalLookup(args.api_key, cache)
         ols = OLSLookup(cache)
         lookup = ConceptLookup(bioportal, ols, args.ontologies)
@@ -253,11 +427,19 @@ Examples:
         
         # Determine if we're in schema mode
         schema_mode = args.schema_mode or (args.input_format and args.input_format.lower() in ['yaml', 'json', 'markdown', 'md'])
+        input_format = args.input_format
+        if not schema_mode and not input_format:
+            # Route schema files without an explicit flag away from the RDF parser
+            kind = _detect_input_kind(args.ttl_file)
+            if kind != 'rdf':
+                schema_mode = True
+                input_format = kind
         
         if schema_mode:
             # Schema file processing mode
             print("\n📋 Schema File Processing Mode")
-            schema_parser = SchemaParser(args.ttl_file, args.input_format)
+            from core import SchemaParser
+            schema_parser = SchemaParser(args.ttl_file, input_format)
             
             # Parse schema
             if not schema_parser.parse():
@@ -285,7 +467,8 @@ Examples:
                         print(f"     - {iri}")
         else:
             # RDF ontology file processing mode
-            ontology = OntologyParser(args.ttl_file, args.input_format)
+            from core import OntologyParser
+            ontology = OntologyParser(args.ttl_file, input_format)
             
             # Parse ontology
             if not ontology.parse():
@@ -308,18 +491,23 @@ Examples:
         # Generate improved ontology
         if selections:
             if args.terminal_only:
-                print(f"\n🎉 TERMINAL-ONLY MODE: Selections processed")
-                print(f"  Concepts aligned: {len(selections)}")
-                total_alignments = sum(len(alignments) for alignments in selections.values())
-                print(f"  Total alignments: {total_alignments}")
+                # Count and render the alignments in a single pass
+                total_alignments = 0
+                lines = []
                 for concept_key, alignments in selections.items():
-                    print(f"\n  {concept_key}:")
+                    total_alignments += len(alignments)
+                    lines.append(f"\n  {concept_key}:")
                     for alignment in alignments:
-                        source_icon = "🌐" if alignment['source'] == 'bioportal' else "🔬"
-                        print(f"    {source_icon} {alignment['label']} ({alignment['ontology']})")
-                        print(f"      URI: {alignment['uri']}")
+                        source_icon = _SOURCE_ICONS.get(alignment['source'], '🎭')
+                        lines.append(f"    {source_icon} {alignment['label']} ({alignment['ontology']})")
+                        lines.append(f"      URI: {alignment['uri']}")
                         if alignment.get('description'):
-                            print(f"      Description: {alignment['description'][:100]}...")
+                            lines.append(f"      Description: {alignment['description'][:100]}...")
+                
+                print(f"\n🎉 TERMINAL-ONLY MODE: Selections processed")
+                print(f"  Concepts aligned: {len(selections)}")
+                print(f"  Total alignments: {total_alignments}")
+                print("\n".join(lines))
             else:
                 if schema_mode:
                     # For schema mode, convert to RDF graph first
@@ -335,11 +523,11 @@ Examples:
         if cache_config.enabled:
             self._show_cache_stats(cache)
 
-    def _show_cache_stats(self, cache: CacheManager):
+    def _show_cache_stats(self, cache: 'CacheManager'):
         """Display cache statistics"""
         stats = cache.get_stats()
         print(f"\n📊 Cache Statistics")
-        print("=" * 45)
+        print(_SEP_45)
         print(f"Status: {'Enabled' if stats['enabled'] else 'Disabled'}")
         print(f"Hit Rate: {stats['hit_rate']} ({stats['hits']} hits, {stats['misses']} misses)")
         print(f"Memory Entries: {stats['memory_entries']}")
@@ -350,16 +538,67 @@ Examples:
             print(f"⚠️  Errors: {stats['errors']}")
         print()
         
-    def _single_word_mode(self, args, lookup: ConceptLookup, generator: OntologyGenerator, 
-                          cache: CacheManager, cache_config):
+    def _format_results(self, options: List[Dict], comparison: Dict) -> str:
+        """Render the service comparison summary and numbered result options
+        
+        The text is built in one piece so each concept is written with a single print.
+        
+        Args:
+            options: Combined lookup results
+            comparison: Comparison summary from ResultComparator
+            
+        Returns:
+            Text to print before the selection prompt
+        """
+        lines = []
+        
+        # Display comparison summary
+        if comparison['discrepancies']:
+            lines.append(f"\n⚠️  Service Comparison Alert:")
+            lines.extend(f"   • {discrepancy}" for discrepancy in comparison['discrepancies'])
+            lines.append(f"   BioPortal: {comparison['bioportal_count']} results")
+            lines.append(f"   OLS: {comparison['ols_count']} results")
+            lines.append("")
+        
+        # Display options
+        lines.append(f"✅ Found {len(options)} standardized terms:")
+        for j, result in enumerate(options, 1):
+            source = result['source']
+            uri = result['uri']
+            description = result.get('description')
+            synonyms = result.get('synonyms')
+            ols_only_indicator = " (OLS-only)" if result.get('ols_only') else ""
+            
+            # Fixed part of each option rendered by one f-string
+            lines.append(f"{j:2d}. {_SOURCE_ICONS.get(source, '🎭')} {result['label']}{ols_only_indicator}\n"
+                         f"     Ontology: {result['ontology']} | Source: {source}\n"
+                         f"     URI: {uri[:70] + '...' if len(uri) > 70 else uri}")
+            
+            # Show description if available
+            if description and description.strip():
+                desc = description[:120] + "..." if len(description) > 120 else description
+                lines.append(f"     Description: {desc}")
+            
+            # Show synonyms if available
+            if synonyms:
+                synonyms_str = ", ".join(synonyms[:3])  # Show max 3 synonyms
+                if len(synonyms) > 3:
+                    synonyms_str += f" (+ {len(synonyms) - 3} more)"
+                lines.append(f"     Synonyms: {synonyms_str}")
+            
+            lines.append("")
+        return "\n".join(lines)
+
+    def _single_word_mode(self, args, lookup: 'ConceptLookup', generator: 'OntologyGenerator', 
+                          cache: 'CacheManager', cache_config):
         """Handle single word query mode"""
         print(f"\n🔍 Single Word Query Mode")
         print(f"Query: '{args.single_word}'")
-        print("=" * 40)
+        print(_SEP_40)
         
         # Create a mock concept for the single word
         concept = {
-            'key': args.single_word.replace(' ', '_'),
+            'key': args.single_word.translate(_KEY_TRANS),
             'label': args.single_word,
             'type': 'Term',
             'category': 'query'
@@ -372,38 +611,8 @@ Examples:
             print(f"❌ No results found for '{args.single_word}'")
             return
         
-        # Display comparison summary
-        if comparison['discrepancies']:
-            print(f"\n⚠️  Service Comparison Alert:")
-            for discrepancy in comparison['discrepancies']:
-                print(f"   • {discrepancy}")
-            print(f"   BioPortal: {comparison['bioportal_count']} results")
-            print(f"   OLS: {comparison['ols_count']} results")
-            print()
-        
-        # Display options
-        print(f"✅ Found {len(options)} standardized terms:")
-        for j, result in enumerate(options, 1):
-            source_indicator = "🌐" if result['source'] == 'bioportal' else "🔬" if result['source'] == 'ols' else "🎭"
-            ols_only_indicator = " (OLS-only)" if result.get('ols_only') else ""
-            
-            print(f"{j:2d}. {source_indicator} {result['label']}{ols_only_indicator}")
-            print(f"     Ontology: {result['ontology']} | Source: {result['source']}")
-            print(f"     URI: {result['uri'][:70]}{'...' if len(result['uri']) > 70 else ''}")
-            
-            # Show description if available
-            if result.get('description') and result['description'].strip():
-                desc = result['description'][:120] + "..." if len(result['description']) > 120 else result['description']
-                print(f"     Description: {desc}")
-            
-            # Show synonyms if available
-            if result.get('synonyms') and len(result['synonyms']) > 0:
-                synonyms_str = ", ".join(result['synonyms'][:3])  # Show max 3 synonyms
-                if len(result['synonyms']) > 3:
-                    synonyms_str += f" (+ {len(result['synonyms']) - 3} more)"
-                print(f"     Synonyms: {synonyms_str}")
-            
-            print()
+        # Display comparison summary and options
+        print(self._format_results(options, comparison))
         
         # Get user selection
         while True:
@@ -414,8 +623,12 @@ Examples:
                     print(f"⏭️  Skipped {args.single_word}")
                     return
                 
-                # Parse multiple selections
-                selected_indices = [int(x.strip()) for x in choice.split(',') if x.strip()]
+                if not _SELECTION_RE.match(choice):
+                    print("❌ Invalid input. Please enter numbers separated by commas.")
+                    continue
+                
+                # Parse multiple selections (validated above, so int() cannot fail)
+                selected_indices = [int(n) for n in _OPTION_NUMBER_RE.findall(choice)]
                 valid_selections = []
                 
                 for idx in selected_indices:
@@ -439,7 +652,7 @@ Examples:
                     
                     # Show selected items
                     for sel in valid_selections:
-                        source_icon = "🌐" if sel['source'] == 'bioportal' else "🔬"
+                        source_icon = _SOURCE_ICONS.get(sel['source'], '🎭')
                         print(f"   {source_icon} {sel['label']} ({sel['ontology']})")
                     
                     # Generate simple ontology for the single word
@@ -448,7 +661,7 @@ Examples:
                         print(f"  Query: {args.single_word}")
                         print(f"  Alignments found: {len(valid_selections)}")
                         for sel in valid_selections:
-                            source_icon = "🌐" if sel['source'] == 'bioportal' else "🔬"
+                            source_icon = _SOURCE_ICONS.get(sel['source'], '🎭')
                             print(f"    {source_icon} {sel['label']} ({sel['ontology']})")
                             print(f"      URI: {sel['uri']}")
                             if sel.get('description'):
@@ -464,8 +677,6 @@ Examples:
                 else:
                     print("❌ No valid selections. Try again.")
                     
-            except ValueError:
-                print("❌ Invalid input. Please enter numbers separated by commas.")
             except KeyboardInterrupt:
                 print(f"\n\n⏹️  Interrupted. Exiting...")
                 sys.exit(0)
@@ -473,113 +684,134 @@ Examples:
     def _load_batch_selections(self, batch_file: str) -> Dict:
         """Load pre-made selections from JSON file"""
         try:
-            with open(batch_file, 'r') as f:
-                return json.load(f)
+            with open(batch_file, 'rb') as f:
+                content = f.read()
+            return orjson.loads(content) if orjson is not None else json.loads(content)
         except Exception as e:
             print(f"❌ Error loading batch file {batch_file}: {e}")
             return {}
 
-    def _interactive_selection(self, concepts: List[Dict], lookup: ConceptLookup) -> Dict:
+    def _stop_prefetching(self, prefetcher: ThreadPoolExecutor, prefetches: List[Future]):
+        """Cancel queued background lookups without waiting for running ones
+        
+        Otherwise lookups nobody will look at still run before the process can exit.
+        """
+        for future in prefetches:
+            future.cancel()
+        prefetcher.shutdown(wait=False)
+
+    def _save_comparison_report(self, all_comparisons: Dict):
+        """Write the service comparison report for the concepts looked up so far"""
+        if not all_comparisons:
+            return
+        
+        report_file = 'service_comparison_report.json'
+        if orjson is not None:
+            report = orjson.dumps(all_comparisons, option=orjson.OPT_INDENT_2)
+        else:
+            report = json.dumps(all_comparisons, indent=2, ensure_ascii=False).encode('utf-8')
+        
+        # Skip the rewrite when the previous run produced the same report
+        try:
+            with open(report_file, 'rb') as f:
+                unchanged = f.read() == report
+        except OSError:
+            unchanged = False
+        
+        if unchanged:
+            print(f"\n📊 Service comparison report unchanged: {report_file}")
+        else:
+            with open(report_file, 'wb') as f:
+                f.write(report)
+            print(f"\n📊 Service comparison report saved: {report_file}")
+
+    def _interactive_selection(self, concepts: List[Dict], lookup: 'ConceptLookup') -> Dict:
         """Interactive concept selection process with enhanced metadata and comparison"""
         all_selections = {}
         all_comparisons = {}
         
-        for i, concept in enumerate(concepts, 1):
-            print(f"\n{'='*60}")
-            print(f"🔍 Step {i}/{len(concepts)}: {concept['label']} ({concept['type']})")
-            print(f"{'='*60}")
-            
-            # Perform lookup across both services
-            options, comparison = lookup.lookup_concept(concept)
-            all_comparisons[concept['key']] = comparison
-            
-            if not options:
-                print(f"❌ No results found for '{concept['label']}'")
-                continue
-            
-            # Display comparison summary
-            if comparison['discrepancies']:
-                print(f"\n⚠️  Service Comparison Alert:")
-                for discrepancy in comparison['discrepancies']:
-                    print(f"   • {discrepancy}")
-                print(f"   BioPortal: {comparison['bioportal_count']} results")
-                print(f"   OLS: {comparison['ols_count']} results")
-                print()
-            
-            # Display options with enhanced metadata
-            print(f"✅ Found {len(options)} standardized terms:")
-            for j, result in enumerate(options, 1):
-                source_indicator = "🌐" if result['source'] == 'bioportal' else "🔬" if result['source'] == 'ols' else "🎭"
-                ols_only_indicator = " (OLS-only)" if result.get('ols_only') else ""
-                
-                print(f"{j:2d}. {source_indicator} {result['label']}{ols_only_indicator}")
-                print(f"     Ontology: {result['ontology']} | Source: {result['source']}")
-                print(f"     URI: {result['uri'][:70]}{'...' if len(result['uri']) > 70 else ''}")
-                
-                # Show description if available
-                if result.get('description') and result['description'].strip():
-                    desc = result['description'][:120] + "..." if len(result['description']) > 120 else result['description']
-                    print(f"     Description: {desc}")
-                
-                # Show synonyms if available
-                if result.get('synonyms') and len(result['synonyms']) > 0:
-                    synonyms_str = ", ".join(result['synonyms'][:3])  # Show max 3 synonyms
-                    if len(result['synonyms']) > 3:
-                        synonyms_str += f" (+ {len(result['synonyms']) - 3} more)"
-                    print(f"     Synonyms: {synonyms_str}")
-                
-                print()
-            
-            # Get user selection
-            while True:
-                try:
-                    choice = input(f"Choose option(s) for '{concept['label']}' (1-{len(options)}, multiple with commas, 0 to skip): ").strip()
+        # Look up the next concepts in the background while the user is choosing,
+        # so their results are usually cached by the time they are shown
+        prefetcher = ThreadPoolExecutor(max_workers=PREFETCH_AHEAD, thread_name_prefix='prefetch')
+        prefetches = [prefetcher.submit(lookup.prefetch_concept, upcoming)
+                      for upcoming in concepts[1:PREFETCH_AHEAD + 1]]
+        
+        try:
+            try:
+                for i, concept in enumerate(concepts, 1):
+                    if i + PREFETCH_AHEAD < len(concepts):
+                        prefetches.append(prefetcher.submit(lookup.prefetch_concept, concepts[i + PREFETCH_AHEAD]))
                     
-                    if choice == '0':
-                        print(f"⏭️  Skipped {concept['label']}")
-                        break
+                    key = concept['key']
+                    label = concept['label']
+                    # Relationship used for every alignment selected for this concept
+                    relationship = 'owl:sameAs' if concept['category'] == 'instance' else 'rdfs:seeAlso'
                     
-                    # Parse multiple selections
-                    selected_indices = [int(x.strip()) for x in choice.split(',') if x.strip()]
-                    valid_selections = []
+                    print(_STEP_BANNER.format(step=i, total=len(concepts), label=label, type=concept['type']))
                     
-                    for idx in selected_indices:
-                        if 1 <= idx <= len(options):
-                            result = options[idx - 1]
-                            valid_selections.append({
-                                'uri': result['uri'],
-                                'label': result['label'],
-                                'ontology': result['ontology'],
-                                'description': result.get('description', ''),
-                                'synonyms': result.get('synonyms', []),
-                                'source': result['source'],
-                                'relationship': 'owl:sameAs' if concept['category'] == 'instance' else 'rdfs:seeAlso'
-                            })
-                        else:
-                            print(f"⚠️  Invalid choice: {idx}")
+                    # Perform lookup across both services
+                    options, comparison = lookup.lookup_concept(concept)
+                    all_comparisons[key] = comparison
+                    
+                    if not options:
+                        print(f"❌ No results found for '{label}'")
+                        continue
                     
-                    if valid_selections:
-                        all_selections[concept['key']] = valid_selections
-                        print(f"✅ Selected {len(valid_selections)} alignment(s) for {concept['label']}")
+                    # Display comparison summary and options with enhanced metadata
+                    print(self._format_results(options, comparison))
+                    
+                    # Get user selection
+                    while True:
+                        choice = input(f"Choose option(s) for '{label}' (1-{len(options)}, multiple with commas, 0 to skip): ").strip()
                         
-                        # Show selected items
-                        for sel in valid_selections:
-                            source_icon = "🌐" if sel['source'] == 'bioportal' else "🔬"
-                            print(f"   {source_icon} {sel['label']} ({sel['ontology']})")
-                        break
-                    else:
-                        print("❌ No valid selections. Try again.")
+                        if choice == '0':
+                            print(f"⏭️  Skipped {label}")
+                            break
                         
-                except ValueError:
-                    print("❌ Invalid input. Please enter numbers separated by commas.")
-                except KeyboardInterrupt:
-                    print(f"\n\n⏹️  Interrupted. Exiting...")
-                    sys.exit(0)
-        
-        # Save comparison report
-        if all_comparisons:
-            with open('service_comparison_report.json', 'w') as f:
-                json.dump(all_comparisons, f, indent=2)
-            print(f"\n📊 Service comparison report saved: service_comparison_report.json")
+                        if not _SELECTION_RE.match(choice):
+                            print("❌ Invalid input. Please enter numbers separated by commas.")
+                            continue
+                        
+                        # Parse multiple selections (validated above, so int() cannot fail)
+                        selected_indices = [int(n) for n in _OPTION_NUMBER_RE.findall(choice)]
+                        valid_selections = []
+                        
+                        for idx in selected_indices:
+                            if 1 <= idx <= len(options):
+                                result = options[idx - 1]
+                                valid_selections.append({
+                                    'uri': result['uri'],
+                                    'label': result['label'],
+                                    'ontology': result['ontology'],
+                                    'description': result.get('description', ''),
+                                    'synonyms': result.get('synonyms', []),
+                                    'source': result['source'],
+                                    'relationship': relationship
+                                })
+                            else:
+                                print(f"⚠️  Invalid choice: {idx}")
+                        
+                        if valid_selections:
+                            all_selections[key] = valid_selections
+                            print(f"✅ Selected {len(valid_selections)} alignment(s) for {label}")
+                            
+                            # Show selected items
+                            for sel in valid_selections:
+                                source_icon = _SOURCE_ICONS.get(sel['source'], '🎭')
+                                print(f"   {source_icon} {sel['label']} ({sel['ontology']})")
+                            break
+                        else:
+                            print("❌ No valid selections. Try again.")
+            finally:
+                # Also on errors and interrupts during a lookup, so no background
+                # requests keep running while the process exits
+                self._stop_prefetching(prefetcher, prefetches)
+        except (KeyboardInterrupt, EOFError):
+            print(f"\n\n⏹️  Interrupted. Exiting...")
+            # Keep the comparisons of the concepts already looked up
+            self._save_comparison_report(all_comparisons)
+            sys.exit(0)
+        
+        self._save_comparison_report(all_comparisons)
         
         return all_selections
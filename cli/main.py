@@ -3,12 +3,12 @@ Main CLI entry point.
 """
 
 import sys
-from .interface import CLIInterface
 
 
 def main():
     """Main entry point"""
     try:
+        from .interface import CLIInterface
         cli = CLIInterface()
         cli.run()
     except KeyboardInterrupt:
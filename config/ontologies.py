@@ -1,11 +1,15 @@
 """
 Ontology configuration constants and mappings.
+
+The tables are read-only views, so callers cannot modify the shared
+configuration by accident.
 """
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 # Ontology descriptions and configurations
-ONTOLOGY_CONFIGS: Dict[str, str] = {
+ONTOLOGY_CONFIGS: Mapping[str, str] = MappingProxyType({
     'MONDO': 'Monarch Disease Ontology - Human diseases and disorders',
     'HP': 'Human Phenotype Ontology - Phenotypic abnormalities',
     'NCIT': 'NCI Thesaurus - Cancer terminology and biomedical concepts',
@@ -30,10 +34,10 @@ ONTOLOGY_CONFIGS: Dict[str, str] = {
     'FMA': 'Foundational Model of Anatomy - Human anatomy',
     'GARD': 'Genetic and Rare Diseases Information Center',
     'OMIM': 'Online Mendelian Inheritance in Man - Genetic disorders'
-}
+})
 
 # Common ontology combinations for different research domains
-ONTOLOGY_COMBINATIONS: Dict[str, str] = {
+ONTOLOGY_COMBINATIONS: Mapping[str, str] = MappingProxyType({
     'Disease Research': 'MONDO,HP,DOID,NCIT,ORDO',
     'Symptom/Phenotype': 'HP,SYMP,NCIT',
     'Chemical/Drug': 'CHEBI,RXNORM,NCIT',
@@ -41,10 +45,10 @@ ONTOLOGY_COMBINATIONS: Dict[str, str] = {
     'Anatomy': 'UBERON,FMA,CL',
     'Clinical': 'SNOMEDCT,ICD10,ICD11,LOINC,CPT',
     'General Medical': 'NCIT,HP,MONDO,MESH'
-}
+})
 
 # Search strategies for different concept types
-SEARCH_STRATEGIES: Dict[str, Dict[str, Any]] = {
+SEARCH_STRATEGIES: Mapping[str, Dict[str, Any]] = MappingProxyType({
     'Disease': {
         'variants': ['disease', 'medical condition', 'disorder'],
         'ontologies': 'MONDO,HP,DOID,NCIT'
@@ -77,10 +81,10 @@ SEARCH_STRATEGIES: Dict[str, Dict[str, Any]] = {
         'variants': ['immune dysfunction', 'immune system disorder', 'immune response abnormality'],
         'ontologies': 'GO,HP,NCIT'
     }
-}
+})
 
 # BioPortal to OLS ontology mapping
-BIOPORTAL_TO_OLS_MAPPING: Dict[str, str] = {
+BIOPORTAL_TO_OLS_MAPPING: Mapping[str, str] = MappingProxyType({
     'MONDO': 'mondo',
     'HP': 'hp',
     'GO': 'go',
@@ -89,4 +93,4 @@ BIOPORTAL_TO_OLS_MAPPING: Dict[str, str] = {
     'DOID': 'doid',
     'SYMP': 'symp',
     'PRO': 'pr'
-}
+})
@@ -2,9 +2,29 @@
 Core module for ontology mapping operations.
 """
 
-from .parser import OntologyParser
-from .schema_parser import SchemaParser
-from .lookup import ConceptLookup
-from .generator import OntologyGenerator
+import importlib
+
+# Imported on first access (PEP 562) so that e.g. importing core.parser does
+# not pull in the HTTP clients used by ConceptLookup.
+_LAZY_ATTRIBUTES = {
+    'OntologyParser': '.parser',
+    'SchemaParser': '.schema_parser',
+    'ConceptLookup': '.lookup',
+    'OntologyGenerator': '.generator',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = ['OntologyParser', 'SchemaParser', 'ConceptLookup', 'OntologyGenerator']
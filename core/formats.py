@@ -0,0 +1,73 @@
+"""
+Supported input and output formats.
+
+Kept free of rdflib imports so that format listings and lookups do not need
+to load the RDF stack.
+"""
+
+# Supported input formats
+SUPPORTED_INPUT_FORMATS = {
+    # RDF formats (via rdflib)
+    'turtle': 'turtle',
+    'ttl': 'turtle',
+    'json-ld': 'json-ld',
+    'jsonld': 'json-ld',
+    'xml': 'xml',
+    'rdf': 'xml',
+    'rdf-xml': 'xml',
+    'rdfxml': 'xml',
+    'nt': 'nt',
+    'ntriples': 'nt',
+    'n-triples': 'nt',
+    'n3': 'n3',
+    'trig': 'trig',
+    'nquads': 'nquads',
+}
+
+# Input format descriptions for help text
+INPUT_FORMAT_DESCRIPTIONS = {
+    'turtle': 'Turtle - Human-readable RDF format',
+    'json-ld': 'JSON-LD - JSON format for linked data',
+    'xml': 'RDF/XML - Traditional RDF XML format',
+    'nt': 'N-Triples - Simple line-based RDF format',
+    'n3': 'Notation3 - Superset of Turtle with rules',
+    'trig': 'TriG - Turtle with named graphs',
+    'nquads': 'N-Quads - N-Triples with named graphs'
+}
+
+# Supported output formats
+SUPPORTED_FORMATS = {
+    # RDF formats (via rdflib)
+    'turtle': 'turtle',
+    'ttl': 'turtle',
+    'json-ld': 'json-ld',
+    'jsonld': 'json-ld',
+    'xml': 'xml',
+    'rdf': 'xml',  # .rdf files use RDF/XML
+    'rdf-xml': 'xml',
+    'rdfxml': 'xml',
+    'nt': 'nt',
+    'ntriples': 'nt',
+    'n-triples': 'nt',
+    'n3': 'n3',
+    'trig': 'trig',
+    'nquads': 'nquads',
+    # Custom formats
+    'csv': 'csv',
+    'tsv': 'tsv',
+    'sssom': 'sssom'
+}
+
+# Output format descriptions for help text
+FORMAT_DESCRIPTIONS = {
+    'turtle': 'Turtle (default) - Human-readable RDF format',
+    'json-ld': 'JSON-LD - JSON format for linked data',
+    'xml': 'RDF/XML - Traditional RDF XML format',
+    'nt': 'N-Triples - Simple line-based RDF format',
+    'n3': 'Notation3 - Superset of Turtle with rules',
+    'trig': 'TriG - Turtle with named graphs',
+    'nquads': 'N-Quads - N-Triples with named graphs',
+    'csv': 'CSV - Comma-separated values (tabular)',
+    'tsv': 'TSV - Tab-separated values (tabular)',
+    'sssom': 'SSSOM TSV - Simple Standard for Sharing Ontology Mappings'
+}
@@ -3,56 +3,82 @@ Ontology generation utilities.
 """
 
 import os
+import re
 import json
 import csv
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rdflib import Graph, RDF, RDFS, OWL, SKOS, URIRef, Literal
-from rdflib.namespace import DCTERMS
+from rdflib.namespace import DCTERMS, PROV, XSD, Namespace
+from rdflib.plugins.serializers.nt import _nt_row
 
 from utils.helpers import clean_description, deduplicate_synonyms, determine_alignment_type
+from .formats import SUPPORTED_FORMATS, FORMAT_DESCRIPTIONS
 from .parser import OntologyParser
 
 
-# Supported output formats
-SUPPORTED_FORMATS = {
-    # RDF formats (via rdflib)
-    'turtle': 'turtle',
-    'ttl': 'turtle',
-    'json-ld': 'json-ld',
-    'jsonld': 'json-ld',
-    'xml': 'xml',
-    'rdf': 'xml',  # .rdf files use RDF/XML
-    'rdf-xml': 'xml',
-    'rdfxml': 'xml',
-    'nt': 'nt',
-    'ntriples': 'nt',
-    'n-triples': 'nt',
-    'n3': 'n3',
-    'trig': 'trig',
-    'nquads': 'nquads',
-    # Custom formats
-    'csv': 'csv',
-    'tsv': 'tsv',
-    'sssom': 'sssom'
+# PROV-O terms, built once instead of for every triple
+_PROV_ENTITY = PROV.Entity
+_PROV_ACTIVITY = PROV.Activity
+_PROV_SOFTWARE_AGENT = PROV.SoftwareAgent
+_PROV_WAS_ATTRIBUTED_TO = PROV.wasAttributedTo
+_PROV_WAS_ASSOCIATED_WITH = PROV.wasAssociatedWith
+_PROV_WAS_GENERATED_BY = PROV.wasGeneratedBy
+_PROV_STARTED_AT_TIME = PROV.startedAtTime
+_PROV_ENDED_AT_TIME = PROV.endedAtTime
+_XSD_INTEGER = XSD.integer
+_XSD_DATE_TIME = XSD.dateTime
+
+# Namespaces of the generated alignment resources
+_BIOPORTAL_ONTOLOGIES = Namespace("http://bioportal.bioontology.org/ontologies/")
+_EX_ONTOLOGY = Namespace("http://example.org/ontology#")
+_EX_QUERY = Namespace("http://example.org/query#")
+_EX_VOCAB = Namespace("http://example.org/vocab#")
+
+# OBO PURLs of external terms, e.g. http://purl.obolibrary.org/obo/CHEBI_15377
+_OBO_TERM_RE = re.compile(r'http://purl\.obolibrary\.org/obo/([A-Za-z][A-Za-z0-9]*)_')
+
+# Formats whose rdflib writers group statements and abbreviate names, which
+# gets slow on large graphs, and the size from which N-Triples is suggested
+_PRETTY_RDF_FORMATS = frozenset(('turtle', 'n3', 'trig'))
+_LARGE_GRAPH_TRIPLES = 200_000
+
+# Buffer for RDF output files, so serializers issue fewer, larger writes
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# SKOS mapping predicate by alignment type (anything else becomes rdfs:seeAlso)
+_ALIGNMENT_PREDICATES = {
+    'exact': SKOS.exactMatch,
+    'close': SKOS.closeMatch,
+    'related': SKOS.relatedMatch,
+    'broader': SKOS.broadMatch,
+    'narrower': SKOS.narrowMatch,
 }
 
-# Format descriptions for help text
-FORMAT_DESCRIPTIONS = {
-    'turtle': 'Turtle (default) - Human-readable RDF format',
-    'json-ld': 'JSON-LD - JSON format for linked data',
-    'xml': 'RDF/XML - Traditional RDF XML format',
-    'nt': 'N-Triples - Simple line-based RDF format',
-    'n3': 'Notation3 - Superset of Turtle with rules',
-    'trig': 'TriG - Turtle with named graphs',
-    'nquads': 'N-Quads - N-Triples with named graphs',
-    'csv': 'CSV - Comma-separated values (tabular)',
-    'tsv': 'TSV - Tab-separated values (tabular)',
-    'sssom': 'SSSOM TSV - Simple Standard for Sharing Ontology Mappings'
+# SSSOM predicate_id of each mapping predicate
+_SSSOM_PREDICATE_IDS = {
+    SKOS.exactMatch: 'skos:exactMatch',
+    SKOS.closeMatch: 'skos:closeMatch',
+    SKOS.relatedMatch: 'skos:relatedMatch',
+    SKOS.broadMatch: 'skos:broadMatch',
+    SKOS.narrowMatch: 'skos:narrowMatch',
+    RDFS.seeAlso: 'rdfs:seeAlso',
 }
 
 
+@lru_cache(maxsize=4096)
+def _lit_en(text: str) -> Literal:
+    """English-language literal; labels and synonyms repeat across alignments"""
+    return Literal(text, lang='en')
+
+
 class OntologyGenerator:
     """Generates improved ontologies with alignments"""
     
@@ -101,7 +127,11 @@ class OntologyGenerator:
                 self._serialize_tabular(graph, output_file, format_name)
         else:
             # RDF serialization via rdflib
-            graph.serialize(destination=output_file, format=format_name)
+            if format_name in _PRETTY_RDF_FORMATS and len(graph) > _LARGE_GRAPH_TRIPLES:
+                print(f"💡 Tip: {len(graph):,} triples - writing {format_name} may take a while, "
+                      f"use --format nt for large ontologies")
+            with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                graph.serialize(destination=f, format=format_name, encoding='utf-8')
     
     def _serialize_tabular(self, graph: Graph, output_file: str, format_name: str):
         """Serialize graph to CSV/TSV format"""
@@ -144,23 +174,9 @@ class OntologyGenerator:
         
         # Extract mapping information from graph
         for s, p, o in graph:
-            if p in [SKOS.exactMatch, SKOS.closeMatch, SKOS.relatedMatch, 
-                     SKOS.broadMatch, SKOS.narrowMatch, RDFS.seeAlso]:
+            predicate_id = _SSSOM_PREDICATE_IDS.get(p)
+            if predicate_id:
                 if isinstance(o, URIRef):
-                    # Determine mapping predicate
-                    if p == SKOS.exactMatch:
-                        predicate_id = 'skos:exactMatch'
-                    elif p == SKOS.closeMatch:
-                        predicate_id = 'skos:closeMatch'
-                    elif p == SKOS.relatedMatch:
-                        predicate_id = 'skos:relatedMatch'
-                    elif p == SKOS.broadMatch:
-                        predicate_id = 'skos:broadMatch'
-                    elif p == SKOS.narrowMatch:
-                        predicate_id = 'skos:narrowMatch'
-                    else:
-                        predicate_id = 'rdfs:seeAlso'
-                    
                     # Get labels using helper method
                     subject_label = self._get_entity_label(s, graph)
                     object_label = self._get_entity_label(o, graph)
@@ -184,6 +200,83 @@ class OntologyGenerator:
             writer.writeheader()
             writer.writerows(mappings)
     
+    def _bind_obo_prefixes(self, graph: Graph, selections: Dict):
+        """Bind a prefix for every OBO ontology used by the selected alignments
+        
+        Binding them up front lets the serializer abbreviate e.g. CHEBI_ and
+        UBERON_ terms from known namespaces instead of working out new ones.
+        
+        Args:
+            graph: Graph that will be serialized
+            selections: Dictionary of concept alignments
+        """
+        obo_prefixes = set()
+        for alignments in selections.values():
+            for alignment in alignments:
+                match = _OBO_TERM_RE.match(alignment['uri'])
+                if match:
+                    obo_prefixes.add(match.group(1))
+        
+        bound = {str(namespace) for _, namespace in graph.namespaces()}
+        for prefix in sorted(obo_prefixes):
+            namespace = f"http://purl.obolibrary.org/obo/{prefix}_"
+            if namespace not in bound:
+                graph.bind(prefix.lower(), namespace, override=False)
+    
+    def _alignment_triples(self, local_uri: URIRef, concept_key: str, alignment: Dict,
+                           seen_synonyms: set, add_label: bool = True):
+        """Build the mapping and metadata triples of one selected alignment
+        
+        Args:
+            local_uri: URI of the local concept being aligned
+            concept_key: Key of the local concept
+            alignment: Selected alignment (uri, ontology, label, description, synonyms)
+            seen_synonyms: Lowercased altLabels already added to the local
+                concept; updated with the synonyms added here
+            add_label: Whether to add the alignment label as skos:prefLabel
+        
+        Returns:
+            Tuple of the alignment type and the list of (s, p, o) triples
+        """
+        # Determine alignment type and relationship based on confidence
+        alignment_type = determine_alignment_type(alignment, concept_key)
+        
+        # Add standardized alignment relationship and metadata
+        scheme_uri = _BIOPORTAL_ONTOLOGIES[alignment['ontology']]
+        triples = [
+            (local_uri, _ALIGNMENT_PREDICATES.get(alignment_type, RDFS.seeAlso), URIRef(alignment['uri'])),
+            (local_uri, SKOS.inScheme, scheme_uri),
+            (local_uri, DCTERMS.source, scheme_uri),
+        ]
+        
+        label = alignment.get('label')
+        if add_label and label and label.strip():
+            triples.append((local_uri, SKOS.prefLabel, _lit_en(label)))
+        
+        description = alignment.get('description')
+        if description and description.strip():
+            clean_desc = clean_description(description)
+            if clean_desc:
+                triples.append((local_uri, DCTERMS.description, _lit_en(clean_desc)))
+        
+        # Add synonyms using SKOS altLabel, avoiding duplicates
+        synonyms = alignment.get('synonyms')
+        if synonyms:
+            for synonym in deduplicate_synonyms(synonyms, seen_synonyms)[:3]:  # Limit to 3 synonyms
+                triples.append((local_uri, SKOS.altLabel, _lit_en(synonym)))
+                seen_synonyms.add(synonym.lower())
+        
+        return alignment_type, triples
+    
+    def _write_report(self, report: Dict, report_file: str):
+        """Write a generation report as indented JSON, using orjson when available"""
+        if orjson is not None:
+            content = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+        else:
+            content = json.dumps(report, indent=2, ensure_ascii=False).encode('utf-8')
+        with open(report_file, 'wb') as f:
+            f.write(content)
+    
     def _determine_output_format(self, output_file: str, output_format: Optional[str]) -> str:
         """Determine the output format from explicit format parameter or filename
         
@@ -218,15 +311,15 @@ class OntologyGenerator:
         print(f"\n💾 Generating Improved Ontology ({format_name})")
         print("=" * 35)
         
-        # Create enhanced graph
-        improved_graph = Graph()
+        # One timestamp for the whole alignment run, shared by every alignment
+        run_started = Literal(datetime.now().isoformat(), datatype=_XSD_DATE_TIME)
         
-        # Copy original ontology
-        for s, p, o in ontology.graph:
-            improved_graph.add((s, p, o))
+        # Create enhanced graph; alignments are added first and the original
+        # ontology is merged in afterwards, unless the output can be streamed
+        improved_graph = Graph()
         
         # Add namespace bindings - using standard vocabularies
-        improved_graph.bind("", "http://example.org/ontology#")
+        improved_graph.bind("", _EX_ONTOLOGY)
         improved_graph.bind("owl", OWL)
         improved_graph.bind("skos", SKOS)
         improved_graph.bind("dcterms", DCTERMS)
@@ -237,91 +330,83 @@ class OntologyGenerator:
         improved_graph.bind("ncit", "http://purl.obolibrary.org/obo/NCIT_")
         improved_graph.bind("efo", "http://www.ebi.ac.uk/efo/EFO_")
         improved_graph.bind("doid", "http://purl.obolibrary.org/obo/DOID_")
+        improved_graph.bind("vocab", _EX_VOCAB)
+        self._bind_obo_prefixes(improved_graph, selections)
         
-        # Add alignments with standardized properties
+        # Add alignments with standardized properties; the triples of each
+        # concept are collected as quads and inserted with a single addN call
         total_alignments = 0
+        quads = []
+        added_lines = []  # Printed at once after the loop
         for concept_key, alignments in selections.items():
-            local_uri = URIRef(f"http://example.org/ontology#{concept_key}")
+            local_uri = _EX_ONTOLOGY[concept_key]
+            seen_synonyms = set()  # Lowercased altLabels already added to this concept
             
             for alignment in alignments:
-                external_uri = URIRef(alignment['uri'])
-                
-                # Determine alignment type and relationship based on confidence
-                alignment_type = determine_alignment_type(alignment, concept_key)
-                
-                # Add standardized alignment relationship
-                if alignment_type == 'exact':
-                    improved_graph.add((local_uri, SKOS.exactMatch, external_uri))
-                elif alignment_type == 'close':
-                    improved_graph.add((local_uri, SKOS.closeMatch, external_uri))
-                elif alignment_type == 'related':
-                    improved_graph.add((local_uri, SKOS.relatedMatch, external_uri))
-                elif alignment_type == 'broader':
-                    improved_graph.add((local_uri, SKOS.broadMatch, external_uri))
-                elif alignment_type == 'narrower':
-                    improved_graph.add((local_uri, SKOS.narrowMatch, external_uri))
-                else:
-                    improved_graph.add((local_uri, RDFS.seeAlso, external_uri))
-                
-                # Add standard metadata using SKOS and DCTERMS
-                improved_graph.add((local_uri, SKOS.inScheme, URIRef(f"http://bioportal.bioontology.org/ontologies/{alignment['ontology']}")))
-                improved_graph.add((local_uri, DCTERMS.source, URIRef(f"http://bioportal.bioontology.org/ontologies/{alignment['ontology']}")))
-                
-                # Use standard SKOS properties for labels and descriptions
-                if alignment.get('label') and alignment['label'].strip():
-                    improved_graph.add((local_uri, SKOS.prefLabel, Literal(alignment['label'], lang='en')))
-                
-                # Add description using standard DCTERMS
-                if alignment.get('description') and alignment['description'].strip():
-                    clean_desc = clean_description(alignment['description'])
-                    if clean_desc:
-                        improved_graph.add((local_uri, DCTERMS.description, Literal(clean_desc, lang='en')))
-                
-                # Add synonyms using SKOS altLabel, avoiding duplicates
-                if alignment.get('synonyms'):
-                    unique_synonyms = deduplicate_synonyms(alignment['synonyms'], set())
-                    for synonym in unique_synonyms[:3]:  # Limit to 3 synonyms
-                        improved_graph.add((local_uri, SKOS.altLabel, Literal(synonym, lang='en')))
+                alignment_type, triples = self._alignment_triples(
+                    local_uri, concept_key, alignment, seen_synonyms, add_label=True)
+                quads.extend((s, p, o, improved_graph) for s, p, o in triples)
                 
                 # Add provenance for this alignment
-                prov_node = URIRef(f"http://example.org/ontology#alignment_{concept_key}_{total_alignments}")
-                improved_graph.add((prov_node, RDF.type, URIRef("http://www.w3.org/ns/prov#Entity")))
-                improved_graph.add((prov_node, URIRef("http://www.w3.org/ns/prov#wasAttributedTo"), 
-                                 URIRef(f"http://example.org/ontology#{alignment['source']}_service")))
-                improved_graph.add((prov_node, DCTERMS.created, Literal(datetime.now().isoformat())))
+                prov_node = _EX_ONTOLOGY[f"alignment_{concept_key}_{total_alignments}"]
+                quads.append((prov_node, RDF.type, _PROV_ENTITY, improved_graph))
+                quads.append((prov_node, _PROV_WAS_ATTRIBUTED_TO, 
+                              _EX_ONTOLOGY[f"{alignment['source']}_service"], improved_graph))
+                quads.append((prov_node, DCTERMS.created, run_started, improved_graph))
                 
                 total_alignments += 1
                 source_icon = "🌐" if alignment['source'] == 'bioportal' else "🔬"
-                print(f"✅ {source_icon} {concept_key} → {alignment['label']} ({alignment['ontology']}) [{alignment_type}]")
+                added_lines.append(f"✅ {source_icon} {concept_key} → {alignment['label']} ({alignment['ontology']}) [{alignment_type}]")
+            
+            improved_graph.addN(quads)
+            quads.clear()
+        
+        if added_lines:
+            print("\n".join(added_lines))
         
         # Add enhanced provenance using PROV-O vocabulary
         prov_activity = URIRef("http://example.org/ontology#BioPortalCLIAlignment")
-        improved_graph.add((prov_activity, RDF.type, URIRef("http://www.w3.org/ns/prov#Activity")))
-        improved_graph.add((prov_activity, DCTERMS.title, Literal("Ontology Alignment Activity", lang='en')))
+        improved_graph.add((prov_activity, RDF.type, _PROV_ACTIVITY))
+        improved_graph.add((prov_activity, DCTERMS.title, _lit_en("Ontology Alignment Activity")))
         improved_graph.add((prov_activity, DCTERMS.description, 
-                         Literal("Automated ontology alignment using BioPortal and OLS services", lang='en')))
-        improved_graph.add((prov_activity, URIRef("http://www.w3.org/ns/prov#startedAtTime"), 
-                         Literal(datetime.now().isoformat())))
-        improved_graph.add((prov_activity, URIRef("http://www.w3.org/ns/prov#endedAtTime"), 
-                         Literal(datetime.now().isoformat())))
+                         _lit_en("Automated ontology alignment using BioPortal and OLS services")))
+        improved_graph.add((prov_activity, _PROV_STARTED_AT_TIME, run_started))
+        improved_graph.add((prov_activity, _PROV_ENDED_AT_TIME, 
+                         Literal(datetime.now().isoformat(), datatype=_XSD_DATE_TIME)))
         
         # Add tool information
         tool_agent = URIRef("http://example.org/ontology#BioPortalCLITool")
-        improved_graph.add((tool_agent, RDF.type, URIRef("http://www.w3.org/ns/prov#SoftwareAgent")))
-        improved_graph.add((tool_agent, DCTERMS.title, Literal("BioPortal CLI Alignment Tool", lang='en')))
-        improved_graph.add((tool_agent, URIRef("http://www.w3.org/ns/prov#wasAssociatedWith"), prov_activity))
+        improved_graph.add((tool_agent, RDF.type, _PROV_SOFTWARE_AGENT))
+        improved_graph.add((tool_agent, DCTERMS.title, _lit_en("BioPortal CLI Alignment Tool")))
+        improved_graph.add((tool_agent, _PROV_WAS_ASSOCIATED_WITH, prov_activity))
         
         # Add statistics as structured data
         stats_node = URIRef("http://example.org/ontology#AlignmentStatistics")
-        improved_graph.add((stats_node, RDF.type, URIRef("http://www.w3.org/ns/prov#Entity")))
-        improved_graph.add((stats_node, URIRef("http://www.w3.org/ns/prov#wasGeneratedBy"), prov_activity))
-        improved_graph.add((stats_node, URIRef("http://example.org/vocab#alignmentCount"), 
-                         Literal(total_alignments, datatype=URIRef("http://www.w3.org/2001/XMLSchema#integer"))))
-        improved_graph.add((stats_node, URIRef("http://example.org/vocab#conceptCount"), 
-                         Literal(len(selections), datatype=URIRef("http://www.w3.org/2001/XMLSchema#integer"))))
+        improved_graph.add((stats_node, RDF.type, _PROV_ENTITY))
+        improved_graph.add((stats_node, _PROV_WAS_GENERATED_BY, prov_activity))
+        improved_graph.add((stats_node, _EX_VOCAB.alignmentCount, 
+                         Literal(total_alignments, datatype=_XSD_INTEGER)))
+        improved_graph.add((stats_node, _EX_VOCAB.conceptCount, 
+                         Literal(len(selections), datatype=_XSD_INTEGER)))
         
         # Save improved ontology using the specified format
-        self._serialize_graph(improved_graph, output_file, format_name)
+        original_triples = len(ontology.graph)
+        if format_name == 'nt':
+            # N-Triples documents can be concatenated, so the original ontology
+            # is written straight to the file instead of being copied into a
+            # second in-memory graph first. Alignment triples the original
+            # already has are skipped, so none is written twice; the rest use
+            # rdflib's own N-Triples line writer.
+            new_triples = [triple for triple in improved_graph if triple not in ontology.graph]
+            total_triples = original_triples + len(new_triples)
+            with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                ontology.graph.serialize(destination=f, format='nt', encoding='utf-8')
+                f.write(''.join(_nt_row(triple) for triple in new_triples).encode('utf-8'))
+        else:
+            # Merge original ontology (Graph.__iadd__ inserts through addN)
+            improved_graph += ontology.graph
+            total_triples = len(improved_graph)
+            self._serialize_graph(improved_graph, output_file, format_name)
         
         # Generate report only if specified
         if report_file:
@@ -330,15 +415,14 @@ class OntologyGenerator:
                 'input_file': ontology.ttl_file,
                 'output_file': output_file,
                 'output_format': format_name,
-                'original_triples': len(ontology.graph),
-                'improved_triples': len(improved_graph),
+                'original_triples': original_triples,
+                'improved_triples': total_triples,
                 'alignments_added': total_alignments,
                 'concepts_aligned': len(selections),
                 'selections': selections
             }
             
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            self._write_report(report, report_file)
         
         # Print summary
         print(f"\n🎉 SUCCESS!")
@@ -346,16 +430,17 @@ class OntologyGenerator:
         print(f"  Output: {output_file} ({format_name})")
         if report_file:
             print(f"  Report: {report_file}")
-        print(f"  Original triples: {len(ontology.graph):,}")
-        print(f"  New triples: {len(improved_graph) - len(ontology.graph):,}")
-        print(f"  Total triples: {len(improved_graph):,}")
+        print(f"  Original triples: {original_triples:,}")
+        print(f"  New triples: {total_triples - original_triples:,}")
+        print(f"  Total triples: {total_triples:,}")
         print(f"  Concepts aligned: {len(selections)}")
         print(f"  Total alignments: {total_alignments}")
         
         # Show file size
-        if os.path.exists(output_file):
-            size = os.path.getsize(output_file)
-            print(f"  File size: {size:,} bytes")
+        try:
+            print(f"  File size: {os.path.getsize(output_file):,} bytes")
+        except OSError:
+            pass
     
     def generate_single_word_ontology(self, concept: Dict, selections: Dict, 
                                      output_file: str, report_file: Optional[str] = None,
@@ -376,71 +461,47 @@ class OntologyGenerator:
         print(f"\n💾 Generating Ontology for Single Word Query ({format_name})")
         print("=" * 45)
         
+        run_started = Literal(datetime.now().isoformat(), datatype=_XSD_DATE_TIME)
+        
         # Create new graph
         graph = Graph()
         
         # Add namespace bindings
-        graph.bind("", "http://example.org/query#")
+        graph.bind("", _EX_QUERY)
         graph.bind("owl", OWL)
         graph.bind("skos", SKOS)
         graph.bind("dcterms", DCTERMS)
         graph.bind("prov", "http://www.w3.org/ns/prov#")
+        self._bind_obo_prefixes(graph, selections)
         
         # Create local concept
-        local_uri = URIRef(f"http://example.org/query#{concept['key']}")
+        local_uri = _EX_QUERY[concept['key']]
         graph.add((local_uri, RDF.type, OWL.Class))
-        graph.add((local_uri, RDFS.label, Literal(concept['label'], lang='en')))
-        graph.add((local_uri, SKOS.prefLabel, Literal(concept['label'], lang='en')))
+        graph.add((local_uri, RDFS.label, _lit_en(concept['label'])))
+        graph.add((local_uri, SKOS.prefLabel, _lit_en(concept['label'])))
         
-        # Add alignments
+        # Add alignments; all of them describe the same local concept
         total_alignments = 0
+        seen_synonyms = set()  # Lowercased altLabels already added
+        added_lines = []  # Printed at once after the loop
         for concept_key, alignments in selections.items():
             for alignment in alignments:
-                external_uri = URIRef(alignment['uri'])
-                
-                # Determine alignment type
-                alignment_type = determine_alignment_type(alignment, concept_key)
-                
-                # Add standardized alignment relationship
-                if alignment_type == 'exact':
-                    graph.add((local_uri, SKOS.exactMatch, external_uri))
-                elif alignment_type == 'close':
-                    graph.add((local_uri, SKOS.closeMatch, external_uri))
-                elif alignment_type == 'related':
-                    graph.add((local_uri, SKOS.relatedMatch, external_uri))
-                elif alignment_type == 'broader':
-                    graph.add((local_uri, SKOS.broadMatch, external_uri))
-                elif alignment_type == 'narrower':
-                    graph.add((local_uri, SKOS.narrowMatch, external_uri))
-                else:
-                    graph.add((local_uri, RDFS.seeAlso, external_uri))
-                
-                # Add metadata
-                graph.add((local_uri, SKOS.inScheme, URIRef(f"http://bioportal.bioontology.org/ontologies/{alignment['ontology']}")))
-                graph.add((local_uri, DCTERMS.source, URIRef(f"http://bioportal.bioontology.org/ontologies/{alignment['ontology']}")))
-                
-                # Add description
-                if alignment.get('description') and alignment['description'].strip():
-                    clean_desc = clean_description(alignment['description'])
-                    if clean_desc:
-                        graph.add((local_uri, DCTERMS.description, Literal(clean_desc, lang='en')))
-                
-                # Add synonyms
-                if alignment.get('synonyms'):
-                    unique_synonyms = deduplicate_synonyms(alignment['synonyms'], set())
-                    for synonym in unique_synonyms[:3]:
-                        graph.add((local_uri, SKOS.altLabel, Literal(synonym, lang='en')))
+                alignment_type, triples = self._alignment_triples(
+                    local_uri, concept_key, alignment, seen_synonyms, add_label=False)
+                graph.addN((s, p, o, graph) for s, p, o in triples)
                 
                 total_alignments += 1
                 source_icon = "🌐" if alignment['source'] == 'bioportal' else "🔬"
-                print(f"✅ {source_icon} {concept_key} → {alignment['label']} ({alignment['ontology']}) [{alignment_type}]")
+                added_lines.append(f"✅ {source_icon} {concept_key} → {alignment['label']} ({alignment['ontology']}) [{alignment_type}]")
+        
+        if added_lines:
+            print("\n".join(added_lines))
         
         # Add provenance
         prov_activity = URIRef("http://example.org/query#SingleWordAlignment")
-        graph.add((prov_activity, RDF.type, URIRef("http://www.w3.org/ns/prov#Activity")))
-        graph.add((prov_activity, DCTERMS.title, Literal("Single Word Query Alignment", lang='en')))
-        graph.add((prov_activity, URIRef("http://www.w3.org/ns/prov#startedAtTime"), 
-                 Literal(datetime.now().isoformat())))
+        graph.add((prov_activity, RDF.type, _PROV_ACTIVITY))
+        graph.add((prov_activity, DCTERMS.title, _lit_en("Single Word Query Alignment")))
+        graph.add((prov_activity, _PROV_STARTED_AT_TIME, run_started))
         
         # Save ontology using the specified format
         self._serialize_graph(graph, output_file, format_name)
@@ -457,8 +518,7 @@ class OntologyGenerator:
                 'selections': selections
             }
             
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            self._write_report(report, report_file)
         
         # Print summary
         print(f"\n🎉 SUCCESS!")
@@ -470,6 +530,7 @@ class OntologyGenerator:
         print(f"  Total alignments: {total_alignments}")
         
         # Show file size
-        if os.path.exists(output_file):
-            size = os.path.getsize(output_file)
-            print(f"  File size: {size:,} bytes")
+        try:
+            print(f"  File size: {os.path.getsize(output_file):,} bytes")
+        except OSError:
+            pass
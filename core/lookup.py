@@ -2,6 +2,7 @@
 Concept lookup orchestration across multiple services.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Dict, Tuple, Optional
 
 from services import BioPortalLookup, OLSLookup, ResultComparator
@@ -16,26 +17,80 @@ class ConceptLookup:
         self.ols = ols
         self.default_ontologies = default_ontologies
         self.search_strategies = SEARCH_STRATEGIES
+        # Runs the OLS requests of a lookup while BioPortal is being queried
+        self._ols_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='ols-search')
     
-    def lookup_concept(self, concept: Dict, max_results: int = 5) -> Tuple[List[Dict], Dict]:
-        """Perform lookup across both BioPortal and OLS with comparison"""
-        key = concept['key']
+    def _search_plan(self, concept: Dict) -> Tuple[List[str], str]:
+        """Get the query variants and ontologies to search for a concept"""
         label = concept['label']
         
         # Get search strategy
-        strategy = self.search_strategies.get(key, {
+        strategy = self.search_strategies.get(concept['key'], {
             'variants': [label, label.lower()],
             'ontologies': 'MONDO,HP,NCIT'
         })
         
         # Use default ontologies if specified, otherwise use strategy ontologies
-        ontologies = self.default_ontologies or strategy['ontologies']
+        return strategy['variants'], self.default_ontologies or strategy['ontologies']
+    
+    def prefetch_concept(self, concept: Dict, max_results: int = 5):
+        """Warm the service caches for a concept without printing anything
+        
+        Meant to run in a background thread ahead of lookup_concept().
+        """
+        variants, ontologies = self._search_plan(concept)
+        self._prefetch_variants(self.bioportal, variants, ontologies, max_results)
+        self._prefetch_variants(self.ols, variants, ontologies, max_results)
+    
+    @staticmethod
+    def _prefetch_variants(service, variants: List[str], ontologies: str, max_results: int):
+        """Warm one service's cache for all query variants of a concept"""
+        for variant in variants:
+            service.prefetch(variant, ontologies, max_results=max_results)
+    
+    def lookup_concept(self, concept: Dict, max_results: int = 5) -> Tuple[List[Dict], Dict]:
+        """Perform lookup across both BioPortal and OLS with comparison"""
+        label = concept['label']
+        variants, ontologies = self._search_plan(concept)
         
         # Show progress for multiple variants
-        variants = strategy['variants']
         if len(variants) > 1:
             print(f"🔄 Searching {len(variants)} variants for '{label}'...")
         
+        # Start the OLS requests while BioPortal is queried, so the two services'
+        # requests overlap. The OLS searches below take over these futures and
+        # print in the foreground, keeping the output order.
+        ols_pending = [self._ols_executor.submit(self.ols.fetch_uncached, variant, ontologies, max_results)
+                       for variant in variants]
+        try:
+            all_bp_results, all_ols_results = self._search_variants(
+                variants, ontologies, max_results, ols_pending)
+        finally:
+            # Interrupted or failed lookups must not leave requests queued
+            for future in ols_pending:
+                future.cancel()
+        
+        # Compare results
+        comparison = ResultComparator.compare_results(all_bp_results, all_ols_results, label)
+        
+        # Combine and deduplicate results
+        combined_results = self._combine_results(all_bp_results, all_ols_results)
+        
+        return combined_results[:max_results * 2], comparison  # Allow more options
+    
+    def _search_variants(self, variants: List[str], ontologies: str, max_results: int,
+                         ols_pending: List[Future]) -> Tuple[List[Dict], List[Dict]]:
+        """Search both services for every query variant, in order
+        
+        Args:
+            variants: Query variants of the concept
+            ontologies: Comma-separated ontology list
+            max_results: Maximum number of results per search
+            ols_pending: fetch_uncached() futures of the OLS searches, per variant
+            
+        Returns:
+            Tuple of the unique BioPortal and OLS results
+        """
         # Collect results from both services
         all_bp_results = []
         all_ols_results = []
@@ -52,18 +107,13 @@ class ConceptLookup:
                     all_bp_results.append(result)
             
             # OLS search  
-            ols_results = self.ols.search(variant, ontologies, max_results=max_results)
+            ols_results = self.ols.search(variant, ontologies, max_results=max_results,
+                                          pending=ols_pending[i - 1])
             for result in ols_results:
                 if result not in all_ols_results:
                     all_ols_results.append(result)
         
-        # Compare results
-        comparison = ResultComparator.compare_results(all_bp_results, all_ols_results, label)
-        
-        # Combine and deduplicate results
-        combined_results = self._combine_results(all_bp_results, all_ols_results)
-        
-        return combined_results[:max_results * 2], comparison  # Allow more options
+        return all_bp_results, all_ols_results
     
     def _combine_results(self, bp_results: List[Dict], ols_results: List[Dict]) -> List[Dict]:
         """Combine results from both services, avoiding duplicates"""
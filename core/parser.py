@@ -6,36 +6,7 @@ import os
 from typing import List, Dict, Optional
 from rdflib import Graph, RDF, RDFS
 
-
-# Supported input formats
-SUPPORTED_INPUT_FORMATS = {
-    # RDF formats (via rdflib)
-    'turtle': 'turtle',
-    'ttl': 'turtle',
-    'json-ld': 'json-ld',
-    'jsonld': 'json-ld',
-    'xml': 'xml',
-    'rdf': 'xml',
-    'rdf-xml': 'xml',
-    'rdfxml': 'xml',
-    'nt': 'nt',
-    'ntriples': 'nt',
-    'n-triples': 'nt',
-    'n3': 'n3',
-    'trig': 'trig',
-    'nquads': 'nquads',
-}
-
-# Format descriptions for help text
-INPUT_FORMAT_DESCRIPTIONS = {
-    'turtle': 'Turtle - Human-readable RDF format',
-    'json-ld': 'JSON-LD - JSON format for linked data',
-    'xml': 'RDF/XML - Traditional RDF XML format',
-    'nt': 'N-Triples - Simple line-based RDF format',
-    'n3': 'Notation3 - Superset of Turtle with rules',
-    'trig': 'TriG - Turtle with named graphs',
-    'nquads': 'N-Quads - N-Triples with named graphs'
-}
+from .formats import SUPPORTED_INPUT_FORMATS, INPUT_FORMAT_DESCRIPTIONS
 
 
 class OntologyParser:
@@ -37,6 +37,9 @@ except ImportError as e:
                         "Please ensure bioportal_cli.py is available in this folder.")
     sys.exit(1)
 
+# Icon shown in front of a result, by result source
+_SOURCE_ICONS = {'bioportal': '🌐', 'ols': '🔬'}
+
 
 class ConceptAlignmentWindow:
     """Window for selecting alignments for a specific concept"""
@@ -116,7 +119,7 @@ class ConceptAlignmentWindow:
         # Populate tree
         self.checkboxes = {}
         for i, option in enumerate(self.options):
-            source_icon = "🌐" if option['source'] == 'bioportal' else "🔬"
+            source_icon = _SOURCE_ICONS.get(option['source'], '🔬')
             ols_only = " (OLS-only)" if option.get('ols_only') else ""
             
             # Truncate long descriptions
@@ -651,7 +654,7 @@ class BioPortalGUI:
         """Show single word query results for selection"""
         self.log(f"✅ Found {len(options)} standardized terms:")
         for j, result in enumerate(options, 1):
-            source_indicator = "🌐" if result['source'] == 'bioportal' else "🔬" if result['source'] == 'ols' else "🎭"
+            source_indicator = _SOURCE_ICONS.get(result['source'], '🎭')
             ols_only_indicator = " (OLS-only)" if result.get('ols_only') else ""
             
             self.log(f"{j:2d}. {source_indicator} {result['label']}{ols_only_indicator}")
@@ -864,7 +867,7 @@ class BioPortalGUI:
                             improved_graph.add((local_uri, SKOS.altLabel, Literal(synonym, lang='en')))
                     
                     total_alignments += 1
-                    source_icon = "🌐" if alignment['source'] == 'bioportal' else "🔬"
+                    source_icon = _SOURCE_ICONS.get(alignment['source'], '🔬')
                     self.log(f"✅ {source_icon} {concept_key} → {alignment['label']} ({alignment['ontology']}) [{alignment_type}]")
             
             # Add enhanced provenance using PROV-O vocabulary
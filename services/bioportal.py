@@ -26,13 +26,16 @@ class BioPortalLookup:
         
     def search(self, query: str, ontologies: str = "", max_results: int = 5) -> List[Dict]:
         """Search BioPortal for concepts with enhanced metadata"""
-        # Check cache first
-        cached_results = self.cache.get(query, ontologies, 'bioportal')
+        demo_mode = not self.api_key or self.api_key == 'your_api_key_here'
+        
+        # Check cache first; stale entries are refreshed in the background
+        refresh_callback = None if demo_mode else (lambda: self._fetch(query, ontologies, max_results))
+        cached_results = self.cache.get(query, ontologies, 'bioportal', refresh_callback=refresh_callback)
         if cached_results is not None:
             print(f"💾 Using cached BioPortal results for '{query}'")
             return cached_results
         
-        if not self.api_key or self.api_key == 'your_api_key_here':
+        if demo_mode:
             # Demo mode
             demo_results = [{
                 'uri': f"http://demo.org/{query.replace(' ', '_')}",
@@ -46,6 +49,42 @@ class BioPortalLookup:
             self.cache.set(query, ontologies, 'bioportal', demo_results)
             return demo_results
         
+        # Start loading bar
+        loading_bar = LoadingBar(f"🌐 Searching BioPortal for '{query}'", "pulse")
+        loading_bar.start()
+        
+        try:
+            # Fetch and cache; concurrent searches for the same query share one request
+            return self.cache.get_or_compute(query, ontologies, 'bioportal',
+                                             lambda: self._fetch(query, ontologies, max_results))
+        except Exception as e:
+            loading_bar.stop()
+            print(f"❌ BioPortal API Error: {e}")
+            return []
+        finally:
+            loading_bar.stop()
+    
+    def prefetch(self, query: str, ontologies: str = "", max_results: int = 5):
+        """Quietly fetch results into the cache so a later search() is served from it
+        
+        Errors are ignored here; the later search() retries and reports them.
+        """
+        demo_mode = not self.api_key or self.api_key == 'your_api_key_here'
+        if demo_mode or not self.cache.config.enabled:
+            return
+        try:
+            self.cache.get_or_compute(query, ontologies, 'bioportal',
+                                      lambda: self._fetch(query, ontologies, max_results),
+                                      prefetch=True)
+        except Exception:
+            pass
+    
+    def _fetch(self, query: str, ontologies: str, max_results: int) -> List[Dict]:
+        """Query the BioPortal search API and normalize the results
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
         params = {
             "q": query,
             "apikey": self.api_key,
@@ -55,46 +94,33 @@ class BioPortalLookup:
         if ontologies:
             params["ontologies"] = ontologies
         
-        # Start loading bar
-        loading_bar = LoadingBar(f"🌐 Searching BioPortal for '{query}'", "pulse")
-        loading_bar.start()
+        response = requests.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
         
-        try:
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+        results = []
+        for item in data.get("collection", []):
+            uri = item.get("@id", "")
+            label = item.get("prefLabel", "")
             
-            results = []
-            for item in data.get("collection", []):
-                uri = item.get("@id", "")
-                label = item.get("prefLabel", "")
-                
-                # Extract ontology from links
-                ontology = ""
-                for link in item.get("links", {}).values():
-                    if isinstance(link, str) and "/ontologies/" in link:
-                        ontology = link.split("/ontologies/")[-1].split("/")[0]
-                        break
-                
-                # Get additional metadata if available
-                definition = item.get("definition", [""])[0] if item.get("definition") else ""
-                synonyms = item.get("synonym", []) or []
-                
-                results.append({
-                    'uri': uri,
-                    'label': label,
-                    'ontology': ontology,
-                    'description': definition,
-                    'synonyms': synonyms,
-                    'source': 'bioportal'
-                })
+            # Extract ontology from links
+            ontology = ""
+            for link in item.get("links", {}).values():
+                if isinstance(link, str) and "/ontologies/" in link:
+                    ontology = link.split("/ontologies/")[-1].split("/")[0]
+                    break
             
-            # Cache the results
-            self.cache.set(query, ontologies, 'bioportal', results)
-            return results
-        except Exception as e:
-            loading_bar.stop()
-            print(f"❌ BioPortal API Error: {e}")
-            return []
-        finally:
-            loading_bar.stop()
+            # Get additional metadata if available
+            definition = item.get("definition", [""])[0] if item.get("definition") else ""
+            synonyms = item.get("synonym", []) or []
+            
+            results.append({
+                'uri': uri,
+                'label': label,
+                'ontology': ontology,
+                'description': definition,
+                'synonyms': synonyms,
+                'source': 'bioportal'
+            })
+        
+        return results
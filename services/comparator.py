@@ -29,7 +29,7 @@ class ResultComparator:
         
         # Find common terms
         common_labels: Set[str] = set(bp_labels.keys()) & set(ols_labels.keys())
-        for label in common_labels:
+        for label in sorted(common_labels):
             bp_result = bp_labels[label]
             ols_result = ols_labels[label]
             
@@ -45,12 +45,12 @@ class ResultComparator:
         
         # Find BioPortal-only terms
         bp_only_labels: Set[str] = set(bp_labels.keys()) - set(ols_labels.keys())
-        for label in bp_only_labels:
+        for label in sorted(bp_only_labels):
             comparison['bioportal_only'].append(bp_labels[label])
         
         # Find OLS-only terms
         ols_only_labels: Set[str] = set(ols_labels.keys()) - set(bp_labels.keys())
-        for label in ols_only_labels:
+        for label in sorted(ols_only_labels):
             comparison['ols_only'].append(ols_labels[label])
         
         # Identify discrepancies
@@ -3,6 +3,7 @@ OLS API client for ontology lookups.
 """
 
 import requests
+from concurrent.futures import Future
 from typing import List, Dict, Optional
 
 from utils.loading import LoadingBar
@@ -23,14 +24,83 @@ class OLSLookup:
         else:
             self.cache = cache_manager
         
-    def search(self, query: str, ontologies: str = "", max_results: int = 5) -> List[Dict]:
-        """Search OLS for concepts with enhanced metadata"""
-        # Check cache first
-        cached_results = self.cache.get(query, ontologies, 'ols')
+    def search(self, query: str, ontologies: str = "", max_results: int = 5,
+               pending: Optional[Future] = None) -> List[Dict]:
+        """Search OLS for concepts with enhanced metadata
+        
+        Args:
+            query: Search query string
+            ontologies: Comma-separated BioPortal ontology list
+            max_results: Maximum number of results
+            pending: Optional future of fetch_uncached() started earlier for the
+                same query; its results are used instead of a new request
+        """
+        # Check cache first; stale entries are refreshed in the background
+        cached_results = self.cache.get(query, ontologies, 'ols',
+                                        refresh_callback=lambda: self._fetch(query, ontologies, max_results))
         if cached_results is not None:
+            if pending is not None:
+                pending.cancel()
             print(f"💾 Using cached OLS results for '{query}'")
             return cached_results
         
+        def fetch():
+            if pending is not None:
+                results = pending.result()
+                if results is not None:
+                    return results
+            return self._fetch(query, ontologies, max_results)
+        
+        # Start loading bar
+        loading_bar = LoadingBar(f"🔬 Searching OLS for '{query}'", "dots")
+        loading_bar.start()
+        
+        try:
+            # Fetch and cache; concurrent searches for the same query share one request
+            return self.cache.get_or_compute(query, ontologies, 'ols', fetch)
+        except Exception as e:
+            loading_bar.stop()
+            print(f"❌ OLS API Error: {e}")
+            return []
+        finally:
+            loading_bar.stop()
+    
+    def prefetch(self, query: str, ontologies: str = "", max_results: int = 5):
+        """Quietly fetch results into the cache so a later search() is served from it
+        
+        Errors are ignored here; the later search() retries and reports them.
+        """
+        if not self.cache.config.enabled:
+            return
+        try:
+            self.cache.get_or_compute(query, ontologies, 'ols',
+                                      lambda: self._fetch(query, ontologies, max_results),
+                                      prefetch=True)
+        except Exception:
+            pass
+    
+    def fetch_uncached(self, query: str, ontologies: str = "", max_results: int = 5) -> Optional[List[Dict]]:
+        """Fetch results without printing, unless they are already cached
+        
+        Meant to run in a worker thread ahead of search(); does not count
+        cache hits or misses and does not store the results.
+        
+        Returns:
+            Fetched results, or None if the query is cached
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        if self.cache.contains(query, ontologies, 'ols'):
+            return None
+        return self._fetch(query, ontologies, max_results)
+    
+    def _fetch(self, query: str, ontologies: str, max_results: int) -> List[Dict]:
+        """Query the OLS search API and normalize the results
+        
+        Raises:
+            requests.RequestException: If the request fails
+        """
         params = {
             "q": query,
             "rows": max_results,
@@ -43,49 +113,36 @@ class OLSLookup:
             if ols_ontologies:
                 params["ontology"] = ols_ontologies
         
-        # Start loading bar
-        loading_bar = LoadingBar(f"🔬 Searching OLS for '{query}'", "dots")
-        loading_bar.start()
+        response = requests.get(self.base_url, params=params, timeout=30)
+        response.raise_for_status()
+        data = response.json()
         
-        try:
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            
-            results = []
-            docs = data.get("response", {}).get("docs", [])
+        results = []
+        docs = data.get("response", {}).get("docs", [])
+        
+        for item in docs:
+            uri = item.get("iri", "")
+            label = item.get("label", "")
+            ontology = item.get("ontology_name", "").upper()
             
-            for item in docs:
-                uri = item.get("iri", "")
-                label = item.get("label", "")
-                ontology = item.get("ontology_name", "").upper()
-                
-                # Extract description and synonyms
-                description = item.get("description", [""])[0] if item.get("description") else ""
-                synonyms = item.get("synonym", []) or []
-                
-                results.append({
-                    'uri': uri,
-                    'label': label,
-                    'ontology': ontology,
-                    'description': description,
-                    'synonyms': synonyms,
-                    'source': 'ols'
-                })
+            # Extract description and synonyms
+            description = item.get("description", [""])[0] if item.get("description") else ""
+            synonyms = item.get("synonym", []) or []
             
-            # Cache the results
-            self.cache.set(query, ontologies, 'ols', results)
-            return results
-        except Exception as e:
-            loading_bar.stop()
-            print(f"❌ OLS API Error: {e}")
-            return []
-        finally:
-            loading_bar.stop()
+            results.append({
+                'uri': uri,
+                'label': label,
+                'ontology': ontology,
+                'description': description,
+                'synonyms': synonyms,
+                'source': 'ols'
+            })
+        
+        return results
     
     def _convert_ontologies(self, bioportal_ontologies: str) -> str:
         """Convert BioPortal ontology names to OLS equivalents"""
         bp_onts = [ont.strip().upper() for ont in bioportal_ontologies.split(',')]
-        ols_onts = [BIOPORTAL_TO_OLS_MAPPING.get(ont, ont.lower()) for ont in bp_onts if BIOPORTAL_TO_OLS_MAPPING.get(ont)]
+        ols_onts = [BIOPORTAL_TO_OLS_MAPPING[ont] for ont in bp_onts if ont in BIOPORTAL_TO_OLS_MAPPING]
         
         return ','.join(ols_onts) if ols_onts else ""
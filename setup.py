@@ -38,12 +38,14 @@ setup(
     install_requires=requirements,
     entry_points={
         "console_scripts": [
-            "ontology-mapping=main:main",
+            "ontology-mapping=cli.main:main",
             "ontology-gui=gui.launch_gui:main",
         ],
     },
     extras_require={
         "gui": ["tkinter"],
+        "fast": ["orjson>=3.0", "zstandard>=0.15"],
+        "completion": ["shtab>=1.5"],
         "dev": ["pytest", "pytest-cov", "flake8", "black"],
     },
     include_package_data=True,
@@ -6,6 +6,9 @@ Test script for caching functionality
 import sys
 import os
 import time
+import sqlite3
+import tempfile
+import threading
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.abspath('.'))
@@ -20,7 +23,20 @@ def test_cache_config():
     print(f"  Config: {config}")
     assert config.enabled == True
     assert config.ttl > 0
+    assert config.stale_ttl == 0  # Serving stale entries is opt-in
     print("✓ Cache configuration test passed")
+    
+    # Invalid values fall back to the defaults instead of raising
+    os.environ['CACHE_TTL'] = 'one day'
+    os.environ['CACHE_PERSISTENT'] = 'maybe'
+    try:
+        config = CacheConfig()
+        assert config.ttl == 86400
+        assert config.persistent == True
+    finally:
+        del os.environ['CACHE_TTL']
+        del os.environ['CACHE_PERSISTENT']
+    print("✓ Invalid environment values test passed")
 
 
 def test_cache_basic_operations():
@@ -83,6 +99,11 @@ def test_cache_key_generation():
     assert result2 is not None
     assert result3 is not None
     print("✓ Cache key normalization test passed")
+    
+    # Ontology order, spacing and duplicates do not matter
+    result4 = cache.get('cancer', 'hp, MONDO,HP', 'bioportal')
+    assert result4 is not None
+    print("✓ Ontology list normalization test passed")
 
 
 def test_cache_ttl():
@@ -112,6 +133,112 @@ def test_cache_ttl():
     print("✓ Cache entry expired after TTL")
 
 
+def test_cache_negative_ttl():
+    """Test short-lived caching of empty results"""
+    print("\nTesting negative caching...")
+    
+    config = CacheConfig()
+    config.persistent = False
+    config.negative_ttl = 1
+    config.stale_ttl = 60
+    cache = CacheManager(config)
+    
+    cache.set('misspeled', 'HP', 'ols', [])
+    cache.set('found', 'HP', 'ols', [{'uri': 'http://test.org/1', 'label': 'Found'}])
+    assert cache.get('misspeled', 'HP', 'ols') == []
+    print("✓ Empty result cached")
+    
+    time.sleep(1.5)
+    # The stale window does not extend the negative TTL
+    assert cache.get('misspeled', 'HP', 'ols', refresh_callback=lambda: []) is None
+    assert cache.get('misspeled', 'HP', 'ols') is None
+    assert cache.get('found', 'HP', 'ols') is not None
+    print("✓ Empty result expired after negative TTL")
+
+
+def test_cache_stale_while_revalidate():
+    """Test serving stale entries while refreshing in the background"""
+    print("\nTesting stale-while-revalidate...")
+    
+    config = CacheConfig()
+    config.persistent = False
+    config.ttl = 1
+    config.stale_ttl = 60
+    cache = CacheManager(config)
+    
+    old_data = [{'uri': 'http://test.org/1', 'label': 'Old'}]
+    new_data = [{'uri': 'http://test.org/1', 'label': 'New'}]
+    cache.set('stale', 'HP', 'ols', old_data)
+    time.sleep(1.5)
+    
+    # Without a refresh callback an expired entry is a miss
+    assert cache.get('stale', 'HP', 'ols') is None
+    
+    # With a refresh callback the stale entry is served and refreshed
+    result = cache.get('stale', 'HP', 'ols', refresh_callback=lambda: new_data)
+    assert result == old_data
+    for _ in range(50):
+        if cache.get('stale', 'HP', 'ols') == new_data:
+            break
+        time.sleep(0.05)
+    assert cache.get('stale', 'HP', 'ols') == new_data
+    assert cache.get_stats()['stale_hits'] == 1
+    print("✓ Stale-while-revalidate test passed")
+
+
+def test_cache_single_flight():
+    """Test that concurrent fills for the same query fetch only once"""
+    print("\nTesting single-flight cache fills...")
+    
+    config = CacheConfig()
+    config.persistent = False
+    cache = CacheManager(config)
+    
+    calls = []
+    test_data = [{'uri': 'http://test.org/1', 'label': 'Shared'}]
+    
+    def slow_fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return test_data
+    
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        cache.get_or_compute('shared', 'HP', 'ols', slow_fetch))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(calls) == 1
+    assert results == [test_data] * 5
+    # Waiting callers already counted their miss in get(); no extra hits
+    assert cache.get_stats()['hits'] == 0
+    print("✓ Single-flight test passed")
+
+
+def test_cache_prefetch_stats():
+    """Test that background prefetches do not inflate the hit rate"""
+    print("\nTesting prefetch statistics...")
+    
+    config = CacheConfig()
+    config.persistent = False
+    cache = CacheManager(config)
+    test_data = [{'uri': 'http://test.org/1', 'label': 'Prefetched'}]
+    
+    # A prefetch that fetches counts as the miss; the later search is the hit
+    cache.get_or_compute('warm', 'HP', 'ols', lambda: test_data, prefetch=True)
+    assert cache.get('warm', 'HP', 'ols') == test_data
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    
+    # Prefetching a cached key is not counted at all
+    cache.get_or_compute('warm', 'HP', 'ols', lambda: test_data, prefetch=True)
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+    print("✓ Prefetch statistics test passed")
+
+
 def test_cache_clear():
     """Test cache clear operation"""
     print("\nTesting cache clear...")
@@ -137,6 +264,123 @@ def test_cache_clear():
     print("✓ Cache clear test passed")
 
 
+def test_cache_memory_bound():
+    """Test LRU eviction of the in-memory cache"""
+    print("\nTesting in-memory cache size bound...")
+    
+    config = CacheConfig()
+    config.persistent = False
+    config.max_size_mb = 1
+    cache = CacheManager(config)
+    
+    # Each entry is roughly 100 KB, so only ~10 fit into 1 MB
+    big_data = [{'uri': 'http://test.org/big', 'label': 'x' * 100000}]
+    for i in range(20):
+        cache.set(f'big{i}', 'HP', 'bioportal', big_data)
+        # Keep the first entry warm so it is never the least recently used
+        assert cache.get('big0', 'HP', 'bioportal') is not None
+    
+    stats = cache.get_stats()
+    assert stats['memory_entries'] < 20
+    assert stats['memory_bytes'] <= 1024 * 1024
+    assert cache.get('big19', 'HP', 'bioportal') is not None
+    assert cache.get('big1', 'HP', 'bioportal') is None
+    print(f"  Memory entries after eviction: {stats['memory_entries']}")
+    print("✓ Cache memory bound test passed")
+
+
+def test_cache_persistent():
+    """Test persistent cache shared between cache manager instances"""
+    print("\nTesting persistent cache...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = CacheConfig()
+        config.cache_dir = cache_dir
+        config.persistent = True
+        
+        test_data = [{'uri': 'http://test.org/1', 'label': 'Persisted'}]
+        writer = CacheManager(config)
+        writer.set('persisted', 'HP', 'ols', test_data)
+        writer.close()
+        
+        # A fresh manager has an empty memory tier and must read from disk
+        cache = CacheManager(config)
+        result = cache.get('persisted', 'HP', 'ols')
+        assert result == test_data
+        print("✓ Persistent get test passed")
+        
+        # Payloads are stored compressed, not as plain JSON
+        payload = cache._db.execute('SELECT payload FROM entries').fetchone()[0]
+        assert not payload.startswith(b'{')
+        print("✓ Persistent compression test passed")
+        
+        assert cache.delete('persisted', 'HP', 'ols') == True
+        assert CacheManager(config).get('persisted', 'HP', 'ols') is None
+        print("✓ Persistent delete test passed")
+        
+        for i in range(3):
+            cache.set(f'query{i}', 'HP', 'ols', test_data)
+        # Overwriting an entry must not grow the tracked size
+        cache.set('query0', 'HP', 'ols', test_data)
+        cache.flush()
+        stored = cache._db.execute('SELECT COUNT(*), SUM(size) FROM entries').fetchone()
+        assert stored[0] == 3
+        assert cache.get_stats()['persistent_bytes'] == stored[1]
+        print("✓ Persistent size tracking test passed")
+        
+        cache.memory_cache.clear()
+        assert cache.clear() == 3
+        assert CacheManager(config).get('query0', 'HP', 'ols') is None
+        print("✓ Persistent clear test passed")
+
+
+def test_cache_writer_failure():
+    """Test that a failing persistent writer never blocks cache callers"""
+    print("\nTesting persistent writer failures...")
+    
+    with tempfile.TemporaryDirectory() as cache_dir:
+        config = CacheConfig()
+        config.cache_dir = cache_dir
+        config.persistent = True
+        test_data = [{'uri': 'http://test.org/1', 'label': 'Test'}]
+        
+        # The writer connection cannot be opened: the persistent tier is disabled
+        original_open = CacheManager._open_database
+        opened = []
+        def open_once(self):
+            if opened:
+                raise sqlite3.OperationalError('database is locked')
+            opened.append(1)
+            return original_open(self)
+        CacheManager._open_database = open_once
+        try:
+            cache = CacheManager(config)
+        finally:
+            CacheManager._open_database = original_open
+        assert config.persistent == False
+        assert cache.set('query', 'HP', 'ols', test_data)
+        cache.flush()
+        print("✓ Writer connection failure test passed")
+        
+        # The writer thread has stopped: writes and flushes must not block
+        config.persistent = True
+        cache = CacheManager(config)
+        cache._write_queue.put(None)
+        cache._writer.join()
+        
+        def write_many():
+            for i in range(1100):
+                cache.set(f'query{i}', 'HP', 'ols', test_data)
+            cache.flush()
+            cache.clear()
+        worker = threading.Thread(target=write_many, daemon=True)
+        worker.start()
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+        cache.close()
+        print("✓ Stopped writer test passed")
+
+
 def test_cache_stats():
     """Test cache statistics"""
     print("\nTesting cache statistics...")
@@ -173,7 +417,14 @@ def main():
         test_cache_basic_operations()
         test_cache_key_generation()
         test_cache_ttl()
+        test_cache_negative_ttl()
+        test_cache_stale_while_revalidate()
+        test_cache_single_flight()
+        test_cache_prefetch_stats()
         test_cache_clear()
+        test_cache_memory_bound()
+        test_cache_persistent()
+        test_cache_writer_failure()
         test_cache_stats()
         
         print("\n" + "=" * 50)
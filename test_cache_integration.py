@@ -13,6 +13,24 @@ sys.path.insert(0, os.path.abspath('.'))
 
 from cache import CacheManager, CacheConfig
 from services import BioPortalLookup, OLSLookup
+from core.lookup import ConceptLookup
+
+
+class SlowBioPortal:
+    """BioPortal stand-in whose searches take a fixed time"""
+    
+    def search(self, query, ontologies="", max_results=5):
+        time.sleep(0.3)
+        print(f"bioportal {query}")
+        return [{'uri': f'http://bp.org/{query}', 'label': query, 'ontology': 'HP', 'source': 'bioportal'}]
+
+
+class SlowOLS(OLSLookup):
+    """OLS client whose requests take a fixed time and never hit the network"""
+    
+    def _fetch(self, query, ontologies, max_results):
+        time.sleep(0.3)
+        return [{'uri': f'http://ols.org/{query}', 'label': query, 'ontology': 'HP', 'source': 'ols'}]
 
 
 def test_cache_integration():
@@ -169,9 +187,36 @@ def test_cache_integration():
     return True
 
 
+def test_lookup_overlap():
+    """Test that OLS requests overlap BioPortal ones, with or without a cache"""
+    print("\nTesting overlapped BioPortal/OLS lookups...")
+    
+    concept = {'key': 'overlap_test', 'label': 'Overlap', 'type': 'Class'}
+    for enabled in (False, True):
+        config = CacheConfig()
+        config.persistent = False
+        config.enabled = enabled
+        cache = CacheManager(config)
+        lookup = ConceptLookup(SlowBioPortal(), SlowOLS(cache))
+        lookup.search_strategies = {'overlap_test': {'variants': ['overlap one', 'overlap two'], 'ontologies': 'HP'}}
+        
+        start = time.time()
+        options, comparison = lookup.lookup_concept(concept)
+        elapsed = time.time() - start
+        
+        # Two variants, 0.3 s per request: 1.2 s sequential, ~0.6 s overlapped
+        assert elapsed < 1.0, f"lookup took {elapsed:.2f}s"
+        assert [o['source'] for o in options] == ['bioportal', 'bioportal', 'ols', 'ols']
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses']) == (0, 2 if enabled else 0)
+        print(f"   ✓ Cache {'enabled' if enabled else 'disabled'}: {elapsed:.2f}s, stats {stats['hits']}/{stats['misses']}")
+    
+    return True
+
+
 def main():
     try:
-        success = test_cache_integration()
+        success = test_cache_integration() and test_lookup_overlap()
         if success:
             print("🎉 All integration tests completed successfully!")
             return True
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Test script for command-line interface behaviour
+"""
+
+import sys
+import os
+import io
+import json
+import builtins
+import tempfile
+import contextlib
+
+# Add the project root to Python path
+sys.path.insert(0, os.path.abspath('.'))
+
+from cli.interface import CLIInterface
+
+
+def run_cli(argv):
+    """Run the CLI with the given arguments and return its output"""
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = ['main.py'] + argv
+    try:
+        with contextlib.redirect_stdout(output):
+            CLIInterface().run()
+    finally:
+        sys.argv = saved_argv
+    return output.getvalue()
+
+
+def test_list_options():
+    """Test the --list-* options, including abbreviations accepted by argparse"""
+    print("Testing --list-* options...")
+    
+    cases = [
+        (['--list-ontologies'], "Available Ontologies"),
+        (['--list-ont'], "Available Ontologies"),
+        (['--list-formats'], "Available Input and Output Formats"),
+        (['--list-input'], "Available Input Formats"),
+        (['--list-formats', '--no-cache'], "Available Input and Output Formats"),
+    ]
+    for argv, expected in cases:
+        output = run_cli(argv)
+        assert expected in output, f"{argv}: {output[:200]!r}"
+        print(f"✓ {' '.join(argv)}")
+
+
+class FakeLookup:
+    """Concept lookup stand-in that fails on a chosen concept"""
+    
+    def __init__(self, fail_on, error):
+        self.fail_on = fail_on
+        self.error = error
+    
+    def prefetch_concept(self, concept):
+        pass
+    
+    def lookup_concept(self, concept):
+        if concept['key'] == self.fail_on:
+            raise self.error
+        options = [{'uri': 'http://test.org/1', 'label': 'Test', 'ontology': 'HP', 'source': 'ols'}]
+        return options, {'concept': concept['key']}
+
+
+def run_selection(lookup, input_fn=None):
+    """Run the interactive selection with prefetch shutdown recorded"""
+    concepts = [{'key': f'c{i}', 'label': f'Concept {i}', 'category': 'class', 'type': 'Class'}
+                for i in range(6)]
+    cli = CLIInterface()
+    stopped = []
+    original_stop = cli._stop_prefetching
+    cli._stop_prefetching = lambda *args: stopped.append(1) or original_stop(*args)
+    cli._format_results = lambda options, comparison: ''
+    
+    saved_input = builtins.input
+    builtins.input = input_fn or (lambda prompt: '0')
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            cli._interactive_selection(concepts, lookup)
+    finally:
+        builtins.input = saved_input
+        assert stopped, "prefetching was not stopped"
+
+
+def test_interactive_prefetch_shutdown():
+    """Test that background prefetching stops however the selection ends"""
+    print("\nTesting prefetch shutdown...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        saved_cwd = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            # Lookup error
+            try:
+                run_selection(FakeLookup('c2', RuntimeError('service down')))
+                assert False, "lookup error was swallowed"
+            except RuntimeError:
+                pass
+            print("✓ Stopped after a lookup error")
+            
+            # End of piped input
+            def no_input(prompt):
+                raise EOFError
+            try:
+                run_selection(FakeLookup(None, None), no_input)
+                assert False, "end of input did not exit"
+            except SystemExit as e:
+                assert e.code == 0
+            print("✓ Stopped at end of input")
+        finally:
+            os.chdir(saved_cwd)
+
+
+def test_interrupt_saves_comparisons():
+    """Test that an interrupt during a lookup keeps the earlier comparisons"""
+    print("\nTesting comparison report on interrupt...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        saved_cwd = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            try:
+                run_selection(FakeLookup('c2', KeyboardInterrupt()))
+                assert False, "interrupt did not exit"
+            except SystemExit as e:
+                assert e.code == 0
+            
+            with open('service_comparison_report.json') as f:
+                report = json.load(f)
+            assert sorted(report) == ['c0', 'c1'], report
+            print("✓ Report saved after an interrupt during a lookup")
+        finally:
+            os.chdir(saved_cwd)
+
+
+def test_comparison_report_fallback():
+    """Test that the report is byte-identical with and without orjson"""
+    print("\nTesting comparison report without orjson...")
+    
+    import cli.interface as interface
+    if interface.orjson is None:
+        print("⚠️  orjson not installed, skipping")
+        return
+    
+    comparisons = {'sjogren': {'concept': 'Sjögren syndrome', 'bioportal_count': 1, 'ols_count': 2}}
+    reports = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        saved_cwd = os.getcwd()
+        saved_orjson = interface.orjson
+        os.chdir(temp_dir)
+        try:
+            for module in (saved_orjson, None):
+                interface.orjson = module
+                with contextlib.redirect_stdout(io.StringIO()):
+                    CLIInterface()._save_comparison_report(comparisons)
+                with open('service_comparison_report.json', 'rb') as f:
+                    reports.append(f.read())
+                os.remove('service_comparison_report.json')
+        finally:
+            interface.orjson = saved_orjson
+            os.chdir(saved_cwd)
+    
+    assert reports[0] == reports[1], reports
+    print("✓ json fallback writes the same bytes as orjson")
+
+
+def main():
+    print("Testing CLI...")
+    print("=" * 50)
+    
+    try:
+        test_list_options()
+        test_interactive_prefetch_shutdown()
+        test_interrupt_saves_comparisons()
+        test_comparison_report_fallback()
+        
+        print("\n" + "=" * 50)
+        print("✅ All CLI tests passed!")
+        return True
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -175,6 +175,41 @@ def test_sssom_export():
             os.unlink(output_file)
 
 
+def test_synonym_deduplication():
+    """Test that synonyms repeated across alignments are added once"""
+    print(f"\n  Testing synonym deduplication across alignments...")
+    
+    generator = OntologyGenerator()
+    concept = {'key': 'diabetes', 'label': 'Diabetes'}
+    selections = {'diabetes': [
+        {'uri': 'http://purl.obolibrary.org/obo/MONDO_0005015', 'label': 'diabetes mellitus',
+         'ontology': 'MONDO', 'source': 'bioportal', 'synonyms': ['Diabetes Mellitus', 'DM']},
+        {'uri': 'http://purl.obolibrary.org/obo/DOID_9351', 'label': 'diabetes mellitus',
+         'ontology': 'DOID', 'source': 'ols', 'synonyms': ['diabetes mellitus', 'Sugar Diabetes']},
+    ]}
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.ttl', delete=False) as f:
+        output_file = f.name
+    
+    try:
+        generator.generate_single_word_ontology(concept, selections, output_file)
+        graph = Graph()
+        graph.parse(output_file, format='turtle')
+        alt_labels = sorted(str(o) for o in graph.objects(None, SKOS.altLabel))
+        if alt_labels != ['Diabetes Mellitus', 'Sugar Diabetes']:
+            print(f"    ✗ Unexpected altLabels: {alt_labels}")
+            return False
+        
+        print(f"    ✓ altLabels: {alt_labels}")
+        return True
+    except Exception as e:
+        print(f"    ✗ Error: {e}")
+        return False
+    finally:
+        if os.path.exists(output_file):
+            os.unlink(output_file)
+
+
 def test_format_detection():
     """Test format detection from filename"""
     print(f"\n  Testing format detection from filename...")
@@ -264,6 +299,11 @@ def main():
         print("❌ SSSOM export test FAILED")
         all_passed = False
     
+    # Test synonym deduplication
+    if not test_synonym_deduplication():
+        print("❌ Synonym deduplication test FAILED")
+        all_passed = False
+    
     print("\n" + "=" * 50)
     if all_passed:
         print("✅ All format tests passed!")
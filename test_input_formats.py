@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.abspath('.'))
 from rdflib import Graph, RDF, RDFS, OWL, SKOS, URIRef, Literal
 from rdflib.namespace import DCTERMS
 from core.parser import OntologyParser
+from cli.interface import _detect_input_kind
 
 
 def create_test_ontology_graph():
@@ -171,6 +172,45 @@ def test_format_detection():
     return True
 
 
+def test_input_kind_detection():
+    """Test routing of input files to the RDF or schema parser"""
+    print("\n  Testing input kind detection...")
+    
+    test_cases = [
+        ('schema.yaml', 'id: test\n', 'yaml'),
+        ('ontology.ttl', '# comment\n', 'rdf'),
+        ('schema.json', '{"classes": {}}', 'json'),
+        ('ontology.json', '{"@context": {}}', 'rdf'),
+        ('expanded.json', '[{"@id": "http://example.org/a", "@type": ["http://www.w3.org/2002/07/owl#Class"]}]', 'rdf'),
+        ('flattened.json', '{"@graph": [{"@id": "http://example.org/a"}]}', 'rdf'),
+        ('long.json', '[{"http://purl.org/dc/terms/description": [{"@value": "' + 'x' * 600 + '"}], "@id": "http://example.org/a"}]', 'rdf'),
+        ('schema.json', '{"classes": {"Disease": {"description": "uses @id and @type"}}}', 'json'),
+        ('schema', '---\nclasses:\n', 'yaml'),
+        ('schema', 'classes:\n  Disease: {}\n', 'yaml'),
+        ('schema', '# Schema\n\n## Disease\n', 'markdown'),
+        ('ontology', '@prefix ex: <http://example.org/> .\n', 'rdf'),
+        ('ontology', '<?xml version="1.0"?>\n', 'rdf'),
+        ('ontology.owlx', '# ontology\nPREFIX ex: <http://example.org/>\n', 'rdf'),
+        ('ontology.owlx', '# ontology\nbase <http://example.org/>\n', 'rdf'),
+        ('ontology.owlx', '# ontology\n<http://example.org/a> a <http://example.org/B> .\n', 'rdf'),
+        ('ontology', '#comment\n', 'rdf'),
+    ]
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for filename, content, expected in test_cases:
+            path = os.path.join(temp_dir, filename)
+            with open(path, 'w') as f:
+                f.write(content)
+            result = _detect_input_kind(path)
+            if result == expected:
+                print(f"    ✓ {filename} ({content.splitlines()[0]!r}) -> {result}")
+            else:
+                print(f"    ✗ {filename} ({content.splitlines()[0]!r}) -> {result} (expected {expected})")
+                return False
+    
+    return True
+
+
 def test_backward_compatibility():
     """Test backward compatibility with ttl_file attribute"""
     print("\n  Testing backward compatibility...")
@@ -227,6 +267,11 @@ def main():
         print("❌ Format detection test FAILED")
         all_passed = False
     
+    # Test input kind detection
+    if not test_input_kind_detection():
+        print("❌ Input kind detection test FAILED")
+        all_passed = False
+    
     # Test input format parsing
     if not test_input_format_parsing():
         print("❌ Input format parsing test FAILED")
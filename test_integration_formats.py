@@ -7,6 +7,7 @@ Tests the complete workflow from creation to serialization in various formats.
 
 import sys
 import os
+import json
 import tempfile
 
 # Add the project root to Python path
@@ -264,6 +265,80 @@ def test_format_auto_detection():
     return True
 
 
+def test_nt_overlapping_triples():
+    """Test that N-Triples output writes triples shared with the original once"""
+    print("\n  Testing N-Triples output with overlapping triples...")
+    
+    from rdflib import RDF, URIRef
+    from rdflib.namespace import PROV
+    
+    ttl_file = create_test_ttl_file()
+    try:
+        ontology = OntologyParser(ttl_file)
+        assert ontology.parse(), "failed to parse test ontology"
+        # Also added by the generator as alignment provenance
+        ontology.graph.add((URIRef("http://example.org/ontology#BioPortalCLITool"), RDF.type, PROV.SoftwareAgent))
+        
+        selections = {
+            'Diabetes': [{
+                'uri': 'http://purl.obolibrary.org/obo/MONDO_0005015',
+                'label': 'diabetes mellitus',
+                'ontology': 'MONDO',
+                'description': 'A metabolic disease',
+                'synonyms': ['diabetes'],
+                'source': 'bioportal',
+                'relationship': 'skos:exactMatch'
+            }]
+        }
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_file = os.path.join(temp_dir, 'improved.nt')
+            report_file = os.path.join(temp_dir, 'report.json')
+            OntologyGenerator().generate_improved_ontology(ontology, selections, output_file, report_file)
+            
+            with open(output_file, encoding='utf-8') as f:
+                lines = [line for line in f if line.strip()]
+            with open(report_file) as f:
+                report = json.load(f)
+        
+        assert len(lines) == len(set(lines)), "triples written twice"
+        assert len(lines) == report['improved_triples'], (len(lines), report['improved_triples'])
+        print(f"    ✓ {len(lines)} unique triples, matching the report")
+    finally:
+        os.unlink(ttl_file)
+    
+    return True
+
+
+def test_report_fallback():
+    """Test that generation reports are byte-identical with and without orjson"""
+    print("\n  Testing generation report without orjson...")
+    
+    import core.generator as generator_module
+    if generator_module.orjson is None:
+        print("    ⚠ orjson not installed, skipping")
+        return True
+    
+    report = {'concept': 'Sjögren syndrome', 'alignments': 2}
+    generator = OntologyGenerator()
+    contents = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_file = os.path.join(temp_dir, 'report.json')
+        saved_orjson = generator_module.orjson
+        try:
+            for module in (saved_orjson, None):
+                generator_module.orjson = module
+                generator._write_report(report, report_file)
+                with open(report_file, 'rb') as f:
+                    contents.append(f.read())
+        finally:
+            generator_module.orjson = saved_orjson
+    
+    assert contents[0] == contents[1], contents
+    print("    ✓ json fallback writes the same bytes as orjson")
+    return True
+
+
 def main():
     """Run all integration tests"""
     print("Integration Tests: Multiple Output Format Support")
@@ -286,6 +361,16 @@ def main():
         print("❌ Format auto-detection test FAILED")
         all_passed = False
     
+    # Test N-Triples output with overlapping triples
+    if not test_nt_overlapping_triples():
+        print("❌ N-Triples overlap test FAILED")
+        all_passed = False
+    
+    # Test report fallback
+    if not test_report_fallback():
+        print("❌ Report fallback test FAILED")
+        all_passed = False
+    
     print("\n" + "=" * 50)
     if all_passed:
         print("✅ All integration tests passed!")